@@ -83,22 +83,20 @@ def pull_latest_images(timeout: int | None = None) -> bool:
     Pull the images defined in the updated configs.
 
     If any pull command fails, perhaps due to network connectivity or missing auth,
-    then log appropriate error messages and return False. Else, return True if all
-    images pull successfully.
+    then stop pulling, log appropriate error messages, and return False. Remaining
+    pulls would likely fail the same way, each only after its own timeout. Else,
+    return True if all images pull successfully.
     """
-    successes = [
-        podman_utils.pull_image(image)
-        for image in podman_utils.list_expected_podman_container_images()
-    ]
-    if not all(successes):
-        logger.error(
-            _(
-                "Failed to pull at least one image. "
-                "Please review the logs, check network connectivity, and "
-                "verify your podman credentials before trying again."
+    for image in podman_utils.list_expected_podman_container_images():
+        if not podman_utils.pull_image(image):
+            logger.error(
+                _(
+                    "Failed to pull at least one image. "
+                    "Please review the logs, check network connectivity, and "
+                    "verify your podman credentials before trying again."
+                )
             )
-        )
-        return False
+            return False
     return True
 
 
@@ -3,6 +3,7 @@
 import dataclasses
 import difflib
 import getpass
+import hmac
 import logging
 import secrets
 from gettext import gettext as _
@@ -96,7 +97,8 @@ def prompt_secret(messages: ResetSecretMessages | None = None) -> str | None:
 
     new_secret = getpass.getpass(messages.prompt_enter_value)
     confirm_secret = getpass.getpass(messages.prompt_confirm_value)
-    if new_secret != confirm_secret:
+    # compare_digest avoids short-circuiting on the first mismatched character
+    if not hmac.compare_digest(new_secret.encode(), confirm_secret.encode()):
         logger.error(messages.prompt_values_no_match)
         return None
     return new_secret
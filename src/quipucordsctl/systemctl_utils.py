@@ -134,12 +134,12 @@ def log_start_failure_details() -> None:
     if stdout and not settings.runtime.quiet:
         print(stdout)
     logger.error(
-        START_FAILURE_GUIDANCE
-        % {
+        START_FAILURE_GUIDANCE,
+        {
             "server_software_name": settings.SERVER_SOFTWARE_NAME,
             "server_software_package": settings.SERVER_SOFTWARE_PACKAGE,
             "program_name": settings.PROGRAM_NAME,
-        }
+        },
     )
 
 
@@ -1,5 +1,6 @@
 """Test the "check" command."""
 
+import argparse
 import logging
 import pathlib
 import stat
@@ -234,7 +235,7 @@ def test_run_all_files_missing(
 ):
     """Test run when all files and directories are missing."""
     caplog.set_level(logging.INFO)
-    mock_args = mock.Mock()
+    mock_args = argparse.Namespace()
     mock_check_running.return_value = True
 
     with pytest.raises(SystemExit) as exc_info:
@@ -256,7 +257,7 @@ def test_run_all_files_present_and_valid(
 ):
     """Test run when all files and directories are present and valid."""
     caplog.set_level(logging.INFO)
-    mock_args = mock.Mock()
+    mock_args = argparse.Namespace()
     mock_check_running.return_value = True
 
     create_full_quipucords_structure(temp_config_directories)
@@ -277,7 +278,7 @@ def test_run_some_files_missing(
 ):
     """Test run when some files are missing."""
     caplog.set_level(logging.INFO)
-    mock_args = mock.Mock()
+    mock_args = argparse.Namespace()
     mock_check_running.return_value = True
 
     temp_config_directories["SERVER_DATA_DIR"].mkdir(parents=True, exist_ok=True)
@@ -300,7 +301,7 @@ def test_run_permission_issues(
 ):
     """Test run when files exist but have permission issues."""
     caplog.set_level(logging.INFO)
-    mock_args = mock.Mock()
+    mock_args = argparse.Namespace()
     mock_check_running.return_value = True
 
     create_full_quipucords_structure(temp_config_directories)
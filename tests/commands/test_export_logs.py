@@ -1,5 +1,6 @@
 """Test the "export_logs" command."""
 
+import argparse
 import itertools
 import logging
 import pathlib
@@ -16,7 +17,9 @@ from quipucordsctl.commands import export_logs
 @pytest.fixture
 def mock_shell_utils():
     """Mock the entire shell_utils module to prevent external program execution."""
-    with mock.patch.object(export_logs, "shell_utils") as mock_shell_utils:
+    with mock.patch.object(
+        export_logs, "shell_utils", autospec=True
+    ) as mock_shell_utils:
         yield mock_shell_utils
 
 
@@ -43,8 +46,7 @@ def test_get_description():
 
 def test_run_happy_path(tmp_path: pathlib.Path):
     """Test the run command happy path."""
-    mock_args = mock.Mock()
-    mock_args.output = tmp_path
+    mock_args = argparse.Namespace(output=tmp_path)
     log_name = "server.log"
     expected_archived = f"{settings.SERVER_SOFTWARE_PACKAGE}-logs/{log_name}"
 
@@ -72,8 +74,7 @@ def test_run_output_is_not_dir(tmp_path: pathlib.Path, caplog):
     caplog.set_level(logging.ERROR)
     output = tmp_path / "some.file"
     output.touch()
-    mock_args = mock.Mock()
-    mock_args.output = output
+    mock_args = argparse.Namespace(output=output)
 
     assert export_logs.run(mock_args) is False
     assert "must be a directory" in caplog.text
@@ -85,8 +86,7 @@ def test_run_output_lacks_expected_modes(mode, tmp_path: pathlib.Path, caplog):
     caplog.set_level(logging.ERROR)
     output = tmp_path / "new-dir"
     output.mkdir(mode=mode)
-    mock_args = mock.Mock()
-    mock_args.output = output
+    mock_args = argparse.Namespace(output=output)
 
     try:
         assert export_logs.run(mock_args) is False
@@ -99,8 +99,7 @@ def test_run_output_lacks_expected_modes(mode, tmp_path: pathlib.Path, caplog):
 def test_run_no_exported_files(tmp_path: pathlib.Path, caplog):
     """Test the run command fails if no files were archived."""
     caplog.set_level(logging.ERROR)
-    mock_args = mock.Mock()
-    mock_args.output = tmp_path
+    mock_args = argparse.Namespace(output=tmp_path)
 
     with mock.patch.object(export_logs, "prepare_export_directory", lambda _: None):
         run_res = export_logs.run(mock_args)
@@ -29,6 +29,14 @@ def test_get_description():
     assert "`install`" in install.get_description()
 
 
+@pytest.fixture(scope="module")
+def install_parser():
+    """Build the "install" argument parser once for all setup_parser cases."""
+    parser = argparse.ArgumentParser()
+    install.setup_parser(parser)
+    return parser
+
+
 @pytest.mark.parametrize(
     "args,attr_name,expected",
     (
@@ -40,12 +48,9 @@ def test_get_description():
         ([], "start", True),
     ),
 )
-def test_setup_parser(args, attr_name, expected):
+def test_setup_parser(install_parser, args, attr_name, expected):
     """Test the setup_parser configures parser as expected."""
-    parser = argparse.ArgumentParser()
-    install.setup_parser(parser)
-
-    value = getattr(parser.parse_args(args), attr_name)
+    value = getattr(install_parser.parse_args(args), attr_name)
     if type(expected) is bool:
         assert value is expected
     else:
@@ -78,8 +83,9 @@ def test_install_run(
     with (override_conf_dir / "env-server.env").open("w") as fp:
         fp.write(f"{env_override_key}={env_override_value}\n")
 
-    mock_args = mock.Mock()
-    mock_args.override_conf_dir = override_conf_dir
+    mock_args = argparse.Namespace(
+        override_conf_dir=override_conf_dir, linger=True, quiet=False
+    )
     data_dir = temp_config_directories["SERVER_DATA_DIR"]
     env_dir = temp_config_directories["SERVER_ENV_DIR"]
     systemd_dir = temp_config_directories["SYSTEMD_UNITS_DIR"]
@@ -128,7 +134,7 @@ def test_install_run(
 def test_reset_secrets_happy_path(caplog):
     """Test the installer.reset_secrets helper function."""
     caplog.set_level(logging.ERROR)
-    mock_args = mock.Mock()
+    mock_args = argparse.Namespace()
 
     with mock.patch.object(
         install, "_RESET_SECRETS_MODULE_ERROR_MESSAGE"
@@ -158,7 +164,7 @@ def test_reset_secrets_happy_path(caplog):
 def test_reset_secrets_failure(caplog):
     """Test installer.reset_secrets when a secret reset command fails."""
     caplog.set_level(logging.ERROR)
-    mock_args = mock.Mock()
+    mock_args = argparse.Namespace()
 
     with mock.patch.object(
         install, "_RESET_SECRETS_MODULE_ERROR_MESSAGE"
@@ -239,9 +245,9 @@ def test_install_run_ensure_images_called(
     temp_config_directories: dict[str, pathlib.Path], tmp_path: pathlib.Path
 ):
     """Test that install calls ensure_images."""
-    mock_args = mock.Mock()
-    mock_args.override_conf_dir = None
-    mock_args.start = True
+    mock_args = argparse.Namespace(
+        override_conf_dir=None, start=True, linger=True, quiet=False
+    )
 
     with (
         mock.patch.object(install, "podman_utils") as mock_podman_utils,
@@ -264,9 +270,9 @@ def test_install_run_fails_when_ensure_images_fails(
     temp_config_directories: dict[str, pathlib.Path], tmp_path: pathlib.Path
 ):
     """Test that install returns False when ensure_images fails."""
-    mock_args = mock.Mock()
-    mock_args.override_conf_dir = None
-    mock_args.start = True
+    mock_args = argparse.Namespace(
+        override_conf_dir=None, start=True, linger=True, quiet=False
+    )
 
     with (
         mock.patch.object(install, "podman_utils") as mock_podman_utils,
@@ -289,10 +295,9 @@ def test_install_run_with_no_start_skips_start_service(
     temp_config_directories: dict[str, pathlib.Path], tmp_path: pathlib.Path
 ):
     """Test that install with --no-start does not call start_service."""
-    mock_args = mock.Mock()
-    mock_args.override_conf_dir = None
-    mock_args.start = False
-    mock_args.quiet = False
+    mock_args = argparse.Namespace(
+        override_conf_dir=None, start=False, linger=True, quiet=False
+    )
 
     with (
         mock.patch.object(install, "podman_utils") as mock_podman_utils,
@@ -321,9 +326,7 @@ def test_resolve_override_conf_dir_nonexistent(tmp_path, caplog):
 
 def test_start_server_prints_message_on_quiet_false(capsys):
     """Test start_server prints success message when start succeeds."""
-    mock_args = mock.Mock()
-    mock_args.start = True
-    mock_args.quiet = False
+    mock_args = argparse.Namespace(start=True, quiet=False)
 
     with mock.patch.object(install, "systemctl_utils") as mock_systemctl_utils:
         mock_systemctl_utils.start_service.return_value = True
@@ -338,9 +341,9 @@ def test_install_run_fails_when_start_service_fails(
     temp_config_directories: dict[str, pathlib.Path], tmp_path: pathlib.Path
 ):
     """Test that install returns False when start_service fails."""
-    mock_args = mock.Mock()
-    mock_args.override_conf_dir = None
-    mock_args.start = True
+    mock_args = argparse.Namespace(
+        override_conf_dir=None, start=True, linger=True, quiet=False
+    )
 
     with (
         mock.patch.object(install, "podman_utils") as mock_podman_utils,
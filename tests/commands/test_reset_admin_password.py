@@ -7,7 +7,9 @@ from unittest import mock
 import pytest
 
 from quipucordsctl.commands import reset_admin_password
-from tests.conftest import assert_reset_command_help
+from tests.conftest import assert_reset_command_help, assert_reset_command_is_set
+
+pytestmark = pytest.mark.usefixtures("error_log_level")
 
 
 def test_get_help():
@@ -15,33 +17,29 @@ def test_get_help():
     assert_reset_command_help(reset_admin_password, "admin login password")
 
 
-@mock.patch.object(reset_admin_password.podman_utils, "secret_exists")
-def test_admin_password_is_set(mock_secret_exists):
+def test_admin_password_is_set(monkeypatch):
     """Test is_set just wraps secret_exists."""
-    assert reset_admin_password.is_set() == mock_secret_exists.return_value
-    mock_secret_exists.assert_called_once_with(reset_admin_password.PODMAN_SECRET_NAME)
+    assert_reset_command_is_set(reset_admin_password, monkeypatch)
 
 
 def test_reset_admin_password_run_success(
-    mock_first_time_run, good_secret, mocker, caplog
+    mock_first_time_run, good_secret, mocker, caplog, reset_args
 ):
     """Test reset_admin_password.run succeeds in the default happy path."""
-    mock_first_time_run(reset_admin_password)
+    first_time_run = mock_first_time_run(reset_admin_password)
     mocker.patch.object(
         reset_admin_password.secrets,
         "prompt_secret",
         return_value=good_secret,
     )
-    mocker.patch.object(
-        reset_admin_password.podman_utils, "set_secret", return_value=True
-    )
+    first_time_run.set_secret.return_value = True
 
-    caplog.set_level(logging.DEBUG)
-    assert reset_admin_password.run(argparse.Namespace())
+    caplog.set_level(logging.DEBUG, logger="quipucordsctl.secrets")
+    assert reset_admin_password.run(reset_args)
     assert "The admin login password was successfully updated." == caplog.messages[-1]
 
 
-def test_reset_admin_password_run_uses_env_var(good_secret, mocker, caplog):
+def test_reset_admin_password_run_uses_env_var(good_secret, mocker, caplog, reset_args):
     """Test reset_admin_password.run successfully uses its environment variable."""
     mocker.patch.object(
         reset_admin_password.podman_utils,
@@ -57,8 +55,8 @@ def test_reset_admin_password_run_uses_env_var(good_secret, mocker, caplog):
         reset_admin_password.podman_utils, "set_secret", return_value=True
     )
 
-    caplog.set_level(logging.DEBUG)
-    assert reset_admin_password.run(argparse.Namespace())
+    caplog.set_level(logging.DEBUG, logger="quipucordsctl.secrets")
+    assert reset_admin_password.run(reset_args)
     assert "The admin login password was successfully updated." == caplog.messages[-1]
     set_secret.assert_called_once_with(
         reset_admin_password.PODMAN_SECRET_NAME, good_secret, False
@@ -66,39 +64,34 @@ def test_reset_admin_password_run_uses_env_var(good_secret, mocker, caplog):
 
 
 def test_reset_admin_password_run_unexpected_failure(
-    mock_first_time_run, good_secret, mocker, caplog
+    mock_first_time_run, good_secret, mocker, caplog, reset_args
 ):
     """Test reset_admin_password.run when set_secret fails unexpectedly."""
-    mock_first_time_run(reset_admin_password)
+    first_time_run = mock_first_time_run(reset_admin_password)
     mocker.patch.object(
         reset_admin_password.secrets,
         "prompt_secret",
         return_value=good_secret,
     )
-    mocker.patch.object(
-        reset_admin_password.podman_utils,
-        "set_secret",
-        return_value=False,
-    )
+    first_time_run.set_secret.return_value = False
 
-    caplog.set_level(logging.ERROR)
     expected_last_log_message = "The admin login password was not updated."
 
-    assert not reset_admin_password.run(argparse.Namespace())
+    assert not reset_admin_password.run(reset_args)
     assert expected_last_log_message == caplog.messages[0]
 
 
 @mock.patch.object(reset_admin_password.secrets, "build_similar_value_check")
 @mock.patch.object(reset_admin_password.secrets, "reset_secret")
 def test_reset_admin_password_builds_similarity_check_when_username_exists(
-    mock_reset_secret, mock_build_check, faker
+    mock_reset_secret, mock_build_check, faker, reset_args
 ):
     """Test run() builds similarity check when username secret exists."""
     mock_similar_check = mock.Mock()
     mock_build_check.return_value = mock_similar_check
     mock_reset_secret.return_value = True
 
-    reset_admin_password.run(argparse.Namespace())
+    reset_admin_password.run(reset_args)
 
     mock_build_check.assert_called_once_with(
         secret_name=reset_admin_password.USERNAME_SECRET_NAME,
@@ -112,13 +105,13 @@ def test_reset_admin_password_builds_similarity_check_when_username_exists(
 @mock.patch.object(reset_admin_password.secrets, "build_similar_value_check")
 @mock.patch.object(reset_admin_password.secrets, "reset_secret")
 def test_reset_admin_password_skips_similarity_check_when_username_not_exists(
-    mock_reset_secret, mock_build_check
+    mock_reset_secret, mock_build_check, reset_args
 ):
     """Test run() skips similarity check when username secret doesn't exist."""
     mock_build_check.return_value = None
     mock_reset_secret.return_value = True
 
-    reset_admin_password.run(argparse.Namespace())
+    reset_admin_password.run(reset_args)
 
     call_kwargs = mock_reset_secret.call_args.kwargs
     assert "check_similar" not in call_kwargs["check_requirements"]
@@ -154,7 +147,6 @@ def test_reset_admin_password_rejects_similar_to_username(
         return_value=password,
     )
 
-    caplog.set_level(logging.ERROR)
     result = reset_admin_password.run(argparse.Namespace())
 
     assert not result
@@ -174,7 +166,7 @@ def test_reset_admin_password_accepts_different_from_username(
     mock_first_time_run, mocker, caplog, username, password
 ):
     """Test password is accepted when sufficiently different from username."""
-    mock_first_time_run(reset_admin_password)
+    first_time_run = mock_first_time_run(reset_admin_password)
 
     mocker.patch.object(
         reset_admin_password.secrets.podman_utils,
@@ -186,13 +178,9 @@ def test_reset_admin_password_accepts_different_from_username(
         "prompt_secret",
         return_value=password,
     )
-    mocker.patch.object(
-        reset_admin_password.podman_utils,
-        "set_secret",
-        return_value=True,
-    )
+    first_time_run.set_secret.return_value = True
 
-    caplog.set_level(logging.DEBUG)
+    caplog.set_level(logging.DEBUG, logger="quipucordsctl.secrets")
     result = reset_admin_password.run(argparse.Namespace())
 
     assert result
@@ -1,11 +1,14 @@
 """Test the "reset_admin_username" command."""
 
-import argparse
 import logging
 from unittest import mock
 
+import pytest
+
 from quipucordsctl.commands import reset_admin_username
-from tests.conftest import assert_reset_command_help
+from tests.conftest import assert_reset_command_help, assert_reset_command_is_set
+
+pytestmark = pytest.mark.usefixtures("error_log_level")
 
 
 def test_get_help():
@@ -13,32 +16,30 @@ def test_get_help():
     assert_reset_command_help(reset_admin_username, "admin login username")
 
 
-@mock.patch.object(reset_admin_username.podman_utils, "secret_exists")
-def test_admin_username_is_set(mock_secret_exists):
+def test_admin_username_is_set(monkeypatch):
     """Test is_set just wraps secret_exists."""
-    assert reset_admin_username.is_set() == mock_secret_exists.return_value
-    mock_secret_exists.assert_called_once_with(reset_admin_username.PODMAN_SECRET_NAME)
+    assert_reset_command_is_set(reset_admin_username, monkeypatch)
 
 
-def test_reset_admin_username_run_success(mock_first_time_run, mocker, caplog):
+def test_reset_admin_username_run_success(
+    mock_first_time_run, mocker, caplog, reset_args
+):
     """Test reset_admin_username.run succeeds in the default happy path."""
-    mock_first_time_run(reset_admin_username)
+    first_time_run = mock_first_time_run(reset_admin_username)
     test_username = "testuser"
     mocker.patch.object(
         reset_admin_username.secrets,
         "prompt_username",
         return_value=test_username,
     )
-    mocker.patch.object(
-        reset_admin_username.podman_utils, "set_secret", return_value=True
-    )
+    first_time_run.set_secret.return_value = True
 
-    caplog.set_level(logging.DEBUG)
-    assert reset_admin_username.run(argparse.Namespace())
+    caplog.set_level(logging.DEBUG, logger="quipucordsctl.secrets")
+    assert reset_admin_username.run(reset_args)
     assert "The admin login username was successfully updated." == caplog.messages[-1]
 
 
-def test_reset_admin_username_run_uses_env_var(mocker, caplog):
+def test_reset_admin_username_run_uses_env_var(mocker, caplog, reset_args):
     """Test reset_admin_username.run successfully uses its environment variable."""
     test_username = "envuser"
     mocker.patch.object(
@@ -55,8 +56,8 @@ def test_reset_admin_username_run_uses_env_var(mocker, caplog):
         reset_admin_username.podman_utils, "set_secret", return_value=True
     )
 
-    caplog.set_level(logging.DEBUG)
-    assert reset_admin_username.run(argparse.Namespace())
+    caplog.set_level(logging.DEBUG, logger="quipucordsctl.secrets")
+    assert reset_admin_username.run(reset_args)
     assert "The admin login username was successfully updated." == caplog.messages[-1]
     set_secret.assert_called_once_with(
         reset_admin_username.PODMAN_SECRET_NAME, test_username, False
@@ -64,30 +65,27 @@ def test_reset_admin_username_run_uses_env_var(mocker, caplog):
 
 
 def test_reset_admin_username_run_unexpected_failure(
-    mock_first_time_run, mocker, caplog
+    mock_first_time_run, mocker, caplog, reset_args
 ):
     """Test reset_admin_username.run when set_secret fails unexpectedly."""
-    mock_first_time_run(reset_admin_username)
+    first_time_run = mock_first_time_run(reset_admin_username)
     test_username = "testuser"
     mocker.patch.object(
         reset_admin_username.secrets,
         "prompt_username",
         return_value=test_username,
     )
-    mocker.patch.object(
-        reset_admin_username.podman_utils,
-        "set_secret",
-        return_value=False,
-    )
+    first_time_run.set_secret.return_value = False
 
-    caplog.set_level(logging.ERROR)
     expected_last_log_message = "The admin login username was not updated."
 
-    assert not reset_admin_username.run(argparse.Namespace())
+    assert not reset_admin_username.run(reset_args)
     assert expected_last_log_message == caplog.messages[0]
 
 
-def test_reset_admin_username_empty_username_fails(mock_first_time_run, mocker, caplog):
+def test_reset_admin_username_empty_username_fails(
+    mock_first_time_run, mocker, caplog, reset_args
+):
     """Test reset_admin_username.run fails when empty username is provided."""
     mock_first_time_run(reset_admin_username)
     mocker.patch.object(
@@ -96,12 +94,13 @@ def test_reset_admin_username_empty_username_fails(mock_first_time_run, mocker,
         return_value="   ",
     )
 
-    caplog.set_level(logging.ERROR)
-    assert not reset_admin_username.run(argparse.Namespace())
+    assert not reset_admin_username.run(reset_args)
     assert "Username cannot be empty." == caplog.messages[0]
 
 
-def test_reset_admin_username_requires_confirmation_when_replacing(mocker, caplog):
+def test_reset_admin_username_requires_confirmation_when_replacing(
+    mocker, caplog, reset_args
+):
     """Test reset_admin_username.run requires confirmation when replacing existing."""
     mocker.patch.object(
         reset_admin_username.podman_utils,
@@ -119,14 +118,13 @@ def test_reset_admin_username_requires_confirmation_when_replacing(mocker, caplo
         return_value=False,
     )
 
-    caplog.set_level(logging.ERROR)
     expected_log_message = "The admin login username was not updated."
 
-    assert not reset_admin_username.run(argparse.Namespace())
+    assert not reset_admin_username.run(reset_args)
     assert expected_log_message in caplog.messages
 
 
-def test_reset_admin_username_succeeds_with_confirmation(mocker, caplog):
+def test_reset_admin_username_succeeds_with_confirmation(mocker, caplog, reset_args):
     """Test reset_admin_username.run succeeds when user confirms replacement."""
     test_username = "newuser"
     mocker.patch.object(
@@ -158,12 +156,12 @@ def test_reset_admin_username_succeeds_with_confirmation(mocker, caplog):
         reset_admin_username.podman_utils, "set_secret", return_value=True
     )
 
-    caplog.set_level(logging.DEBUG)
-    assert reset_admin_username.run(argparse.Namespace())
+    caplog.set_level(logging.DEBUG, logger="quipucordsctl.secrets")
+    assert reset_admin_username.run(reset_args)
     assert "The admin login username was successfully updated." == caplog.messages[-1]
 
 
-def test_reset_admin_username_empty_env_var_fails(mocker, caplog):
+def test_reset_admin_username_empty_env_var_fails(mocker, caplog, reset_args):
     """Test reset_admin_username.run fails when env var has empty username."""
     mocker.patch.object(
         reset_admin_username.podman_utils,
@@ -176,12 +174,11 @@ def test_reset_admin_username_empty_env_var_fails(mocker, caplog):
         return_value="   ",  # empty/whitespace from env var
     )
 
-    caplog.set_level(logging.ERROR)
-    assert not reset_admin_username.run(argparse.Namespace())
+    assert not reset_admin_username.run(reset_args)
     assert "Username cannot be empty." == caplog.messages[0]
 
 
-def test_reset_admin_username_quiet_mode_fails(mocker, caplog):
+def test_reset_admin_username_quiet_mode_fails(mocker, caplog, reset_args):
     """Test reset_admin_username.run fails in quiet mode without env var."""
     mocker.patch.object(
         reset_admin_username.podman_utils,
@@ -199,15 +196,14 @@ def test_reset_admin_username_quiet_mode_fails(mocker, caplog):
         True,
     )
 
-    caplog.set_level(logging.ERROR)
-    assert not reset_admin_username.run(argparse.Namespace())
+    assert not reset_admin_username.run(reset_args)
     assert (
         "Username is required but cannot be prompted in quiet mode."
         == caplog.messages[0]
     )
 
 
-def test_reset_admin_username_prompt_returns_none(mocker, caplog):
+def test_reset_admin_username_prompt_returns_none(mocker, caplog, reset_args):
     """Test reset_admin_username.run fails when prompt returns None."""
     mocker.patch.object(
         reset_admin_username.podman_utils,
@@ -225,8 +221,7 @@ def test_reset_admin_username_prompt_returns_none(mocker, caplog):
         return_value=None,  # prompt returns None
     )
 
-    caplog.set_level(logging.ERROR)
-    assert not reset_admin_username.run(argparse.Namespace())
+    assert not reset_admin_username.run(reset_args)
     assert "Username cannot be empty." == caplog.messages[0]
     assert "The admin login username was not updated." == caplog.messages[1]
 
@@ -234,14 +229,14 @@ def test_reset_admin_username_prompt_returns_none(mocker, caplog):
 @mock.patch.object(reset_admin_username.secrets, "build_similar_value_check")
 @mock.patch.object(reset_admin_username.secrets, "reset_username")
 def test_reset_admin_username_builds_similarity_check_when_password_exists(
-    mock_reset_username, mock_build_check
+    mock_reset_username, mock_build_check, reset_args
 ):
     """Test run() builds similarity check when password secret exists."""
     mock_similar_check = mock.Mock()
     mock_build_check.return_value = mock_similar_check
     mock_reset_username.return_value = True
 
-    reset_admin_username.run(argparse.Namespace())
+    reset_admin_username.run(reset_args)
 
     mock_build_check.assert_called_once_with(
         secret_name=reset_admin_username.PASSWORD_SECRET_NAME,
@@ -255,13 +250,13 @@ def test_reset_admin_username_builds_similarity_check_when_password_exists(
 @mock.patch.object(reset_admin_username.secrets, "build_similar_value_check")
 @mock.patch.object(reset_admin_username.secrets, "reset_username")
 def test_reset_admin_username_skips_similarity_check_when_password_not_exists(
-    mock_reset_username, mock_build_check
+    mock_reset_username, mock_build_check, reset_args
 ):
     """Test run() skips similarity check when password secret doesn't exist."""
     mock_build_check.return_value = None
     mock_reset_username.return_value = True
 
-    reset_admin_username.run(argparse.Namespace())
+    reset_admin_username.run(reset_args)
 
     call_kwargs = mock_reset_username.call_args.kwargs
     assert "check_similar" not in call_kwargs["check_requirements"]
@@ -270,13 +265,13 @@ def test_reset_admin_username_skips_similarity_check_when_password_not_exists(
 @mock.patch.object(reset_admin_username.secrets, "build_similar_value_check")
 @mock.patch.object(reset_admin_username.secrets, "reset_username")
 def test_reset_admin_username_disables_password_validations(
-    mock_reset_username, mock_build_check
+    mock_reset_username, mock_build_check, reset_args
 ):
     """Test run() disables password-style validations for usernames."""
     mock_build_check.return_value = None
     mock_reset_username.return_value = True
 
-    reset_admin_username.run(argparse.Namespace())
+    reset_admin_username.run(reset_args)
 
     call_kwargs = mock_reset_username.call_args.kwargs
     reqs = call_kwargs["check_requirements"]
@@ -288,7 +283,7 @@ def test_reset_admin_username_disables_password_validations(
 
 
 def test_reset_admin_username_rejects_similar_to_password(
-    mock_first_time_run, mocker, caplog
+    mock_first_time_run, mocker, caplog, reset_args
 ):
     """Test username is rejected when too similar to existing password."""
     mock_first_time_run(reset_admin_username)
@@ -304,18 +299,17 @@ def test_reset_admin_username_rejects_similar_to_password(
         return_value="secretpass",
     )
 
-    caplog.set_level(logging.ERROR)
-    result = reset_admin_username.run(argparse.Namespace())
+    result = reset_admin_username.run(reset_args)
 
     assert not result
     assert "too similar" in caplog.text.lower()
 
 
 def test_reset_admin_username_accepts_different_from_password(
-    mock_first_time_run, mocker, caplog
+    mock_first_time_run, mocker, caplog, reset_args
 ):
     """Test username is accepted when sufficiently different from password."""
-    mock_first_time_run(reset_admin_username)
+    first_time_run = mock_first_time_run(reset_admin_username)
 
     mocker.patch.object(
         reset_admin_username.secrets.podman_utils,
@@ -327,13 +321,9 @@ def test_reset_admin_username_accepts_different_from_password(
         "prompt_username",
         return_value="shadowman",
     )
-    mocker.patch.object(
-        reset_admin_username.podman_utils,
-        "set_secret",
-        return_value=True,
-    )
+    first_time_run.set_secret.return_value = True
 
-    caplog.set_level(logging.DEBUG)
-    result = reset_admin_username.run(argparse.Namespace())
+    caplog.set_level(logging.DEBUG, logger="quipucordsctl.secrets")
+    result = reset_admin_username.run(reset_args)
 
     assert result
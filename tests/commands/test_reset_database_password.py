@@ -1,32 +1,19 @@
 """Test the "reset_database_password" command."""
 
-import argparse
 import logging
-from unittest import mock
 
 import pytest
 
+from quipucordsctl import podman_utils, secrets, shell_utils
 from quipucordsctl.commands import reset_database_password
+from tests.conftest import assert_reset_command_is_set
 
-
-@mock.patch.object(reset_database_password.podman_utils, "secret_exists")
-def test_database_password_is_set(mock_secret_exists):
-    """Test database_password_is_set just wraps secret_exists."""
-    assert reset_database_password.is_set() == mock_secret_exists.return_value
-    mock_secret_exists.assert_called_once_with(
-        reset_database_password.PODMAN_SECRET_NAME
-    )
+pytestmark = pytest.mark.usefixtures("error_log_level")
 
 
-@pytest.fixture
-def first_time_run(mocker):
-    """Mock certain behaviors to act like this is a first-time default run."""
-    mocker.patch.object(
-        reset_database_password.podman_utils, "secret_exists", return_value=False
-    )
-    mocker.patch.object(
-        reset_database_password.secrets.shell_utils, "get_env", return_value=None
-    )
+def test_database_password_is_set(monkeypatch):
+    """Test database_password_is_set just wraps secret_exists."""
+    assert_reset_command_is_set(reset_database_password, monkeypatch)
 
 
 def test_get_help():
@@ -40,45 +27,56 @@ def test_get_description():
 
 
 def test_reset_database_password_run_success(
-    first_time_run, good_secret, mocker, caplog
+    mock_first_time_run, good_secret, caplog, reset_args
 ):
     """Test reset_database_password.run in the default happy path."""
-    mocker.patch.object(
-        reset_database_password.secrets,
-        "generate_random_secret",
-        return_value=good_secret,
-    )
-    mocker.patch.object(
-        reset_database_password.podman_utils, "set_secret", return_value=True
-    )
-
-    caplog.set_level(logging.DEBUG)
+    first_time_run = mock_first_time_run(reset_database_password)
+    first_time_run.generate_random_secret.return_value = good_secret
+    first_time_run.set_secret.return_value = True
+
+    caplog.set_level(logging.DEBUG, logger="quipucordsctl.secrets")
     expected_last_log_messages = [
         "New value for podman secret 'quipucords-db-password' was randomly generated.",
         "The database password was successfully updated.",
     ]
 
-    assert reset_database_password.run(argparse.Namespace())
+    assert reset_database_password.run(reset_args)
     assert expected_last_log_messages == caplog.messages[-2:]
 
 
 def test_reset_database_password_run_set_secret_failure(
-    first_time_run, good_secret, mocker, caplog
+    mock_first_time_run, good_secret, caplog, reset_args
 ):
     """Test reset_database_password.run when set_secret fails unexpectedly."""
-    mocker.patch.object(
-        reset_database_password.secrets,
-        "generate_random_secret",
-        return_value=good_secret,
-    )
-    mocker.patch.object(
-        reset_database_password.podman_utils,
-        "set_secret",
-        return_value=False,  # something broke unexpectedly
-    )
-
-    caplog.set_level(logging.ERROR)
+    first_time_run = mock_first_time_run(reset_database_password)
+    first_time_run.generate_random_secret.return_value = good_secret
+    first_time_run.set_secret.return_value = False  # something broke unexpectedly
+
     expected_last_log_message = "The database password was not updated."
 
-    assert not reset_database_password.run(argparse.Namespace())
+    assert not reset_database_password.run(reset_args)
     assert expected_last_log_message == caplog.messages[0]
+
+
+@pytest.mark.parametrize(
+    "confirm_seq,expected_calls",
+    [
+        pytest.param([False], 1, id="decline-replace-existing"),
+        pytest.param([True, False], 2, id="decline-manual-input"),
+    ],
+)
+def test_reset_database_password_run_decline(
+    confirm_seq, expected_calls, mocker, reset_args
+):
+    """Test reset_database_password.run stops when the user declines a prompt."""
+    mocker.patch.object(podman_utils, "secret_exists", return_value=True)
+    mock_confirm = mocker.patch.object(shell_utils, "confirm", side_effect=confirm_seq)
+    mock_prompt_secret = mocker.patch.object(secrets, "prompt_secret")
+    mock_set_secret = mocker.patch.object(podman_utils, "set_secret")
+
+    reset_args.prompt = True
+
+    assert not reset_database_password.run(reset_args)
+    assert mock_confirm.call_count == expected_calls
+    mock_prompt_secret.assert_not_called()
+    mock_set_secret.assert_not_called()
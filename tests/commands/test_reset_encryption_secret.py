@@ -1,32 +1,18 @@
 """Test the "reset_encryption_secret" command."""
 
-import argparse
 import logging
-from unittest import mock
 
 import pytest
 
 from quipucordsctl.commands import reset_encryption_secret
+from tests.conftest import assert_reset_command_is_set
 
-
-@mock.patch.object(reset_encryption_secret.podman_utils, "secret_exists")
-def test_encryption_secret_is_set(mock_secret_exists):
-    """Test encryption_secret_is_set just wraps secret_exists."""
-    assert reset_encryption_secret.is_set() == mock_secret_exists.return_value
-    mock_secret_exists.assert_called_once_with(
-        reset_encryption_secret.PODMAN_SECRET_NAME
-    )
+pytestmark = pytest.mark.usefixtures("error_log_level")
 
 
-@pytest.fixture
-def first_time_run(mocker):
-    """Mock certain behaviors to act like this is a first-time default run."""
-    mocker.patch.object(
-        reset_encryption_secret.podman_utils, "secret_exists", return_value=False
-    )
-    mocker.patch.object(
-        reset_encryption_secret.secrets.shell_utils, "get_env", return_value=None
-    )
+def test_encryption_secret_is_set(monkeypatch):
+    """Test encryption_secret_is_set just wraps secret_exists."""
+    assert_reset_command_is_set(reset_encryption_secret, monkeypatch)
 
 
 def test_get_help():
@@ -40,46 +26,33 @@ def test_get_description():
 
 
 def test_reset_encryption_secret_run_success(
-    first_time_run, good_secret, mocker, caplog
+    mock_first_time_run, good_secret, caplog, reset_args
 ):
     """Test reset_encryption_secret.run in the default happy path."""
-    mocker.patch.object(
-        reset_encryption_secret.secrets,
-        "generate_random_secret",
-        return_value=good_secret,
-    )
-    mocker.patch.object(
-        reset_encryption_secret.podman_utils, "set_secret", return_value=True
-    )
-
-    caplog.set_level(logging.DEBUG)
+    first_time_run = mock_first_time_run(reset_encryption_secret)
+    first_time_run.generate_random_secret.return_value = good_secret
+    first_time_run.set_secret.return_value = True
+
+    caplog.set_level(logging.DEBUG, logger="quipucordsctl.secrets")
     expected_last_log_messages = [
         "New value for podman secret 'quipucords-encryption-secret-key' "
         "was randomly generated.",
         "The encryption secret key was successfully updated.",
     ]
 
-    assert reset_encryption_secret.run(argparse.Namespace())
+    assert reset_encryption_secret.run(reset_args)
     assert expected_last_log_messages == caplog.messages[-2:]
 
 
 def test_reset_encryption_secret_run_set_secret_failure(
-    first_time_run, good_secret, mocker, caplog
+    mock_first_time_run, good_secret, caplog, reset_args
 ):
     """Test reset_encryption_secret.run when set_secret fails unexpectedly."""
-    mocker.patch.object(
-        reset_encryption_secret.secrets,
-        "generate_random_secret",
-        return_value=good_secret,
-    )
-    mocker.patch.object(
-        reset_encryption_secret.podman_utils,
-        "set_secret",
-        return_value=False,  # something broke unexpectedly
-    )
-
-    caplog.set_level(logging.ERROR)
+    first_time_run = mock_first_time_run(reset_encryption_secret)
+    first_time_run.generate_random_secret.return_value = good_secret
+    first_time_run.set_secret.return_value = False  # something broke unexpectedly
+
     expected_last_log_message = "The encryption secret key was not updated."
 
-    assert not reset_encryption_secret.run(argparse.Namespace())
+    assert not reset_encryption_secret.run(reset_args)
     assert expected_last_log_message == caplog.messages[0]
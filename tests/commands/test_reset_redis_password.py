@@ -1,30 +1,20 @@
 """Test the "reset_redis_password" command."""
 
-import argparse
 import logging
-from unittest import mock
+import types
 
 import pytest
 
+from quipucordsctl import podman_utils, secrets, settings, shell_utils
 from quipucordsctl.commands import reset_redis_password
+from tests.conftest import assert_reset_command_is_set
 
-
-@mock.patch.object(reset_redis_password.podman_utils, "secret_exists")
-def test_redis_password_is_set(mock_secret_exists):
-    """Test redis_password_is_set just wraps secret_exists."""
-    assert reset_redis_password.is_set() == mock_secret_exists.return_value
-    mock_secret_exists.assert_called_once_with(reset_redis_password.PODMAN_SECRET_NAME)
+pytestmark = pytest.mark.usefixtures("error_log_level")
 
 
-@pytest.fixture
-def first_time_run(mocker):
-    """Mock certain behaviors to act like this is a first-time default run."""
-    mocker.patch.object(
-        reset_redis_password.podman_utils, "secret_exists", return_value=False
-    )
-    mocker.patch.object(
-        reset_redis_password.secrets.shell_utils, "get_env", return_value=None
-    )
+def test_redis_password_is_set(monkeypatch):
+    """Test redis_password_is_set just wraps secret_exists."""
+    assert_reset_command_is_set(reset_redis_password, monkeypatch)
 
 
 def test_get_help():
@@ -37,77 +27,82 @@ def test_get_description():
     assert "`reset_redis_password`" in reset_redis_password.get_description()
 
 
-def test_reset_redis_password_run_success(first_time_run, good_secret, mocker, caplog):
-    """Test reset_redis_password.run in the default happy path."""
-    mocker.patch.object(
-        reset_redis_password.secrets,
-        "generate_random_secret",
-        return_value=good_secret,
-    )
-    mocker.patch.object(
-        reset_redis_password.podman_utils, "set_secret", return_value=True
+@pytest.mark.parametrize(
+    "prompt,confirmed,expected_result",
+    (
+        pytest.param(False, None, True, id="random-value"),
+        pytest.param(True, True, True, id="prompt-confirmed"),
+        pytest.param(True, False, False, id="prompt-declined"),
+    ),
+)
+def test_reset_redis_password_run(  # noqa: PLR0913
+    mock_first_time_run,
+    good_secret,
+    mocker,
+    caplog,
+    reset_args,
+    prompt,
+    confirmed,
+    expected_result,
+):
+    """Test reset_redis_password.run with and without interactive input."""
+    first_time_run = mock_first_time_run(reset_redis_password)
+    first_time_run.generate_random_secret.return_value = good_secret
+    first_time_run.set_secret.return_value = True
+    mock_confirm = mocker.patch.object(shell_utils, "confirm", return_value=confirmed)
+    mock_prompt_secret = mocker.patch.object(
+        secrets, "prompt_secret", return_value=good_secret
     )
-
-    caplog.set_level(logging.DEBUG)
-    expected_last_log_messages = [
-        "New value for podman secret 'quipucords-redis-password' "
-        "was randomly generated.",
-        "The Redis password was successfully updated.",
-    ]
-
-    assert reset_redis_password.run(argparse.Namespace())
-    assert expected_last_log_messages == caplog.messages[-2:]
-
-
-def test_reset_redis_password_run_uses_env_var(good_secret, mocker, caplog):
+    reset_args.prompt = prompt
+
+    caplog.set_level(logging.DEBUG, logger="quipucordsctl.secrets")
+    assert reset_redis_password.run(reset_args) is expected_result
+
+    assert mock_confirm.called is prompt
+    assert mock_prompt_secret.called is (prompt and confirmed)
+    if expected_result:
+        first_time_run.set_secret.assert_called_once_with(
+            reset_redis_password.PODMAN_SECRET_NAME, good_secret, False
+        )
+        assert caplog.messages[-1] == "The Redis password was successfully updated."
+    else:
+        first_time_run.set_secret.assert_not_called()
+        assert caplog.messages[-1] == "The Redis password was not updated."
+    if not prompt:
+        assert caplog.messages[-2] == (
+            "New value for podman secret 'quipucords-redis-password' "
+            "was randomly generated."
+        )
+
+
+def test_reset_redis_password_run_uses_env_var(
+    good_secret, mocker, monkeypatch, reset_args
+):
     """Test reset_redis_password.run uses its environment variable.."""
-    mocker.patch.object(
-        reset_redis_password.podman_utils,
-        "secret_exists",
-        return_value=False,
-    )
-    mocker.patch.object(
-        reset_redis_password.secrets.shell_utils,
-        "get_env",
-        return_value=good_secret,
-    )
-
-    set_secret = mocker.patch.object(
-        reset_redis_password.podman_utils, "set_secret", return_value=True
-    )
+    mocker.patch.object(podman_utils, "secret_exists", return_value=False)
+    mocker.patch.object(shell_utils, "get_env", return_value=good_secret)
+    set_secret = mocker.patch.object(podman_utils, "set_secret", return_value=True)
 
     # required b/c non-random values are discouraged
-    secrets_runtime = mocker.patch.object(
-        reset_redis_password.secrets.settings, "runtime"
-    )
-    shell_utils_runtime = mocker.patch.object(
-        reset_redis_password.secrets.shell_utils.settings, "runtime"
+    monkeypatch.setattr(
+        settings, "runtime", types.SimpleNamespace(yes=True, quiet=False)
     )
-    secrets_runtime.yes = shell_utils_runtime.yes = True
 
-    assert reset_redis_password.run(argparse.Namespace())
+    assert reset_redis_password.run(reset_args)
     set_secret.assert_called_once_with(
         reset_redis_password.PODMAN_SECRET_NAME, good_secret, False
     )
 
 
 def test_reset_redis_password_run_set_secret_failure(
-    first_time_run, good_secret, mocker, caplog
+    mock_first_time_run, good_secret, caplog, reset_args
 ):
     """Test reset_redis_password.run when set_secret fails unexpectedly."""
-    mocker.patch.object(
-        reset_redis_password.secrets,
-        "generate_random_secret",
-        return_value=good_secret,
-    )
-    mocker.patch.object(
-        reset_redis_password.podman_utils,
-        "set_secret",
-        return_value=False,  # something broke unexpectedly
-    )
+    first_time_run = mock_first_time_run(reset_redis_password)
+    first_time_run.generate_random_secret.return_value = good_secret
+    first_time_run.set_secret.return_value = False  # something broke unexpectedly
 
-    caplog.set_level(logging.ERROR)
     expected_last_log_message = "The Redis password was not updated."
 
-    assert not reset_redis_password.run(argparse.Namespace())
+    assert not reset_redis_password.run(reset_args)
     assert expected_last_log_message == caplog.messages[0]
@@ -1,5 +1,6 @@
 """Test the "start" command."""
 
+import argparse
 from unittest import mock
 
 from quipucordsctl import argparse_utils, settings
@@ -23,7 +24,7 @@ def test_get_display_group():
 
 def test_start_run_fails_when_not_installed(capsys):
     """Test start returns False with a message when service is not installed."""
-    mock_args = mock.Mock()
+    mock_args = argparse.Namespace()
 
     with mock.patch.object(start, "systemctl_utils") as mock_systemctl_utils:
         mock_systemctl_utils.is_service_installed.return_value = False
@@ -40,8 +41,7 @@ def test_start_run_fails_when_not_installed(capsys):
 
 def test_start_run_happy_path():
     """Test the start command happy path."""
-    mock_args = mock.Mock()
-    mock_args.quiet = False
+    mock_args = argparse.Namespace(quiet=False)
 
     with (
         mock.patch.object(start, "systemctl_utils") as mock_systemctl_utils,
@@ -62,7 +62,7 @@ def test_start_run_happy_path():
 
 def test_start_run_fails_when_ensure_images_fails():
     """Test start returns False when ensure_images fails."""
-    mock_args = mock.Mock()
+    mock_args = argparse.Namespace()
 
     with (
         mock.patch.object(start, "systemctl_utils") as mock_systemctl_utils,
@@ -79,8 +79,7 @@ def test_start_run_fails_when_ensure_images_fails():
 
 def test_start_run_fails_when_start_service_fails():
     """Test start returns False when start_service fails."""
-    mock_args = mock.Mock()
-    mock_args.quiet = False
+    mock_args = argparse.Namespace(quiet=False)
 
     with (
         mock.patch.object(start, "systemctl_utils") as mock_systemctl_utils,
@@ -97,8 +96,7 @@ def test_start_run_fails_when_start_service_fails():
 
 def test_start_run_quiet_suppresses_success_message(capsys):
     """Test that --quiet suppresses the success print."""
-    mock_args = mock.Mock()
-    mock_args.quiet = True
+    mock_args = argparse.Namespace(quiet=True)
 
     with (
         mock.patch.object(start, "systemctl_utils") as mock_systemctl_utils,
@@ -116,8 +114,7 @@ def test_start_run_quiet_suppresses_success_message(capsys):
 
 def test_start_run_prints_success_message(capsys):
     """Test that success message is printed when not quiet."""
-    mock_args = mock.Mock()
-    mock_args.quiet = False
+    mock_args = argparse.Namespace(quiet=False)
 
     with (
         mock.patch.object(start, "systemctl_utils") as mock_systemctl_utils,
@@ -5,10 +5,20 @@ import logging
 import pathlib
 from unittest import mock
 
-from quipucordsctl import settings
+import pytest
+
+from quipucordsctl import podman_utils, settings
 from quipucordsctl.commands import uninstall
 
 
+@pytest.fixture
+def mock_podman_utils(monkeypatch):
+    """Replace uninstall's podman_utils with a fresh autospec'd mock per test."""
+    mock_podman_utils = mock.create_autospec(podman_utils)
+    monkeypatch.setattr(uninstall, "podman_utils", mock_podman_utils)
+    return mock_podman_utils
+
+
 def test_get_help():
     """Mocks the get_help method of the "uninstall" command."""
     assert (
@@ -16,20 +26,17 @@ def test_get_help():
     )
 
 
-def test_remove_container_images(tmp_path: pathlib.Path, monkeypatch, faker):
+def test_remove_container_images(mock_podman_utils, faker):
     """Test remove_container_images invokes expected Podman commands."""
     container_images = {faker.slug(), faker.slug(), faker.slug()}
-    with mock.patch.object(uninstall, "podman_utils") as mock_podman_utils:
-        mock_podman_utils.list_expected_podman_container_images.return_value = set(
-            container_images
-        )
-        uninstall.remove_container_images()
-        remove_image_calls = [
-            mock.call(container_image) for container_image in container_images
-        ]
-        mock_podman_utils.remove_image.assert_has_calls(
-            remove_image_calls, any_order=True
-        )
+    mock_podman_utils.list_expected_podman_container_images.return_value = set(
+        container_images
+    )
+    uninstall.remove_container_images()
+    remove_image_calls = [
+        mock.call(container_image) for container_image in container_images
+    ]
+    mock_podman_utils.remove_image.assert_has_calls(remove_image_calls, any_order=True)
 
 
 def test_remove_file(tmp_path: pathlib.Path):
@@ -47,19 +54,20 @@ def test_remove_file_does_not_exist(tmp_path: pathlib.Path):
     assert uninstall.remove_file(test_file)
 
 
-@mock.patch("pathlib.Path.unlink")
-def test_remove_file_unlink_error(mock_unlink, tmp_path: pathlib.Path):
+def test_remove_file_unlink_error(tmp_path: pathlib.Path, monkeypatch):
     """Test successful remove_file if the file does not exist."""
     test_file = tmp_path / "test_file"
 
     test_file.write_text("test content")
-    mock_unlink.side_effect = Exception("unknown_exception")
+    monkeypatch.setattr(
+        pathlib.Path,
+        "unlink",
+        mock.MagicMock(side_effect=Exception("unknown_exception")),
+    )
     assert not uninstall.remove_file(test_file)
 
 
-@mock.patch("pathlib.Path.exists")
-@mock.patch("pathlib.Path.unlink")
-def test_remove_services(mock_unlink, mock_exists, tmp_path: pathlib.Path, monkeypatch):
+def test_remove_services(tmp_path: pathlib.Path, monkeypatch):
     """Test remove_services invokes expected filesystem calls."""
     # Let's create a systemd generated services directory
     # so the system thinks there are services to delete there too.
@@ -70,54 +78,68 @@ def test_remove_services(mock_unlink, mock_exists, tmp_path: pathlib.Path, monke
     )
 
     # Make sure the system thinks all service files exist.
-    mock_exists.return_value = True
+    monkeypatch.setattr(pathlib.Path, "exists", lambda self: True)
+    unlinked_paths = []
+
+    def record_unlink(path: pathlib.Path):
+        unlinked_paths.append(path)
+
+    monkeypatch.setattr(pathlib.Path, "unlink", record_unlink)
 
     assert uninstall.remove_services()
 
-    assert mock_unlink.call_count == len(settings.TEMPLATE_SERVER_ENV_FILENAMES) + len(
+    assert len(unlinked_paths) == len(settings.TEMPLATE_SERVER_ENV_FILENAMES) + len(
         settings.TEMPLATE_SYSTEMD_UNITS_FILENAMES
     ) + len(settings.SYSTEMD_SERVICE_FILENAMES)
 
 
-@mock.patch("quipucordsctl.commands.uninstall.shutil.rmtree")
-def test_remove_data(mock_rmtree):
+@pytest.fixture
+def rmtree_calls(monkeypatch):
+    """Record shutil.rmtree calls made by uninstall instead of deleting anything."""
+    calls = []
+
+    def record_rmtree(path, **kwargs):
+        calls.append((path, kwargs))
+
+    monkeypatch.setattr(uninstall.shutil, "rmtree", record_rmtree)
+    return calls
+
+
+def test_remove_data(rmtree_calls):
     """Test remove data invokes the expected shell utilities commands."""
     uninstall.remove_data()
-    expected_calls = []
-    for data_dir in settings.SERVER_DATA_SUBDIRS_EXCLUDING_DB.values():
-        expected_calls += [mock.call(data_dir, ignore_errors=True)]
-    mock_rmtree.assert_has_calls(expected_calls)
+    assert rmtree_calls == [
+        (data_dir, {"ignore_errors": True})
+        for data_dir in settings.SERVER_DATA_SUBDIRS_EXCLUDING_DB.values()
+    ]
 
 
-@mock.patch("quipucordsctl.commands.uninstall.shutil.rmtree")
-def test_remove_data_keep_dirs(mock_rmtree, caplog):
+def test_remove_data_keep_dirs(rmtree_calls, caplog):
     """Test remove data only prints when keep_data_dirs=True."""
     caplog.set_level(logging.INFO)
     uninstall.remove_data(True)
-    mock_rmtree.assert_not_called()
+    assert rmtree_calls == []
     assert "Not removing the" in caplog.text
 
 
-def test_remove_secrets():
+def test_remove_secrets(mock_podman_utils):
     """Test removes secrets invokes the expected Podman utilities commands."""
-    with mock.patch.object(uninstall, "podman_utils") as mock_podman_utils:
-        mock_podman_utils.delete_secret.return_value = True
-
-        assert uninstall.remove_secrets()
+    mock_podman_utils.delete_secret.return_value = True
 
-        for key in settings.QUIPUCORDS_SECRET_KEYS:
-            mock_podman_utils.delete_secret.assert_any_call(key)
+    assert uninstall.remove_secrets()
+    assert mock_podman_utils.delete_secret.call_args_list == [
+        mock.call(key) for key in settings.QUIPUCORDS_SECRET_KEYS
+    ]
 
 
-def test_remove_secrets_failure():
+def test_remove_secrets_failure(mock_podman_utils):
     """Test function fails if one secret could not be removed."""
-    with mock.patch.object(uninstall, "podman_utils") as mock_podman_utils:
-        mock_podman_utils.delete_secret.return_value = False
-
-        assert not uninstall.remove_secrets()
+    mock_podman_utils.delete_secret.return_value = False
 
-        key = list(settings.QUIPUCORDS_SECRET_KEYS)[0]
-        mock_podman_utils.delete_secret.assert_any_call(key)
+    assert not uninstall.remove_secrets()
+    assert mock_podman_utils.delete_secret.call_args_list == [
+        mock.call(key) for key in settings.QUIPUCORDS_SECRET_KEYS
+    ]
 
 
 def test_uninstall_run(capsys):
@@ -2,6 +2,7 @@
 
 import argparse
 import logging
+import types
 from unittest import mock
 
 import pytest
@@ -20,6 +21,14 @@ def test_get_description():
     assert "`upgrade` command" in upgrade.get_description()
 
 
+@pytest.fixture(scope="module")
+def upgrade_parser():
+    """Build the "upgrade" argument parser once for all setup_parser cases."""
+    parser = argparse.ArgumentParser()
+    upgrade.setup_parser(parser)
+    return parser
+
+
 @pytest.mark.parametrize(
     "args,attr_name,expected",
     (
@@ -31,12 +40,9 @@ def test_get_description():
         ([], "timeout", settings.DEFAULT_PODMAN_PULL_TIMEOUT),
     ),
 )
-def test_setup_parser(args, attr_name, expected):
+def test_setup_parser(upgrade_parser, args, attr_name, expected):
     """Test the setup_parser configures parser as expected."""
-    parser = argparse.ArgumentParser()
-    upgrade.setup_parser(parser)
-
-    value = getattr(parser.parse_args(args), attr_name)
+    value = getattr(upgrade_parser.parse_args(args), attr_name)
     if type(expected) is bool:
         assert value is expected
     else:
@@ -44,9 +50,9 @@ def test_setup_parser(args, attr_name, expected):
 
 
 @mock.patch("quipucordsctl.commands.upgrade.podman_utils")
-def test_pull_latest_images(mock_podman_utils, faker):
+def test_pull_latest_images(mock_podman_utils, placeholder):
     """Test the pull_latest_images function."""
-    images = [faker.slug() for _ in range(5)]
+    images = [placeholder() for _ in range(5)]
     mock_podman_utils.list_expected_podman_container_images.return_value = images
     mock_podman_utils.pull_image.side_effect = [True for _ in images]
     assert upgrade.pull_latest_images()
@@ -65,102 +71,87 @@ def test_print_success(capsys):
     assert captured.err == ""
 
 
-@mock.patch("quipucordsctl.commands.upgrade.pull_latest_images")
-@mock.patch("quipucordsctl.commands.upgrade.install.run")
-@mock.patch("quipucordsctl.commands.upgrade.systemctl_utils.stop_service")
-def test_run_happy_path(
-    mock_stop_service, mock_install_run, mock_pull_latest_images, caplog
-):
-    """Test the upgrade.run happy path."""
-    caplog.set_level(logging.WARNING)
-    mock_stop_service.return_value = True
-    mock_install_run.return_value = True
-    mock_pull_latest_images.return_value = True
-    mock_args = argparse.Namespace()
-    mock_args.no_pull = False
-    mock_args.timeout = 0
-    mock_args.quiet = False
-    assert upgrade.run(mock_args)
-    assert caplog.record_tuples == []
-
-
-@mock.patch("quipucordsctl.commands.upgrade.pull_latest_images")
-@mock.patch("quipucordsctl.commands.upgrade.install.run")
-@mock.patch("quipucordsctl.commands.upgrade.systemctl_utils.stop_service")
-def test_run_happy_path_no_pull(
-    mock_stop_service, mock_install_run, mock_pull_latest_images, caplog
-):
-    """Test the upgrade.run happy path when "no pull" argument is set."""
-    caplog.set_level(logging.WARNING)
-    mock_stop_service.return_value = True
-    mock_install_run.return_value = True
-    mock_args = argparse.Namespace()
-    mock_args.no_pull = True
-    mock_args.timeout = 0
-    mock_args.quiet = False
-    assert upgrade.run(mock_args)
-    mock_pull_latest_images.assert_not_called()
-    assert "without pulling" in caplog.messages[-1]
-
-
-@mock.patch("quipucordsctl.commands.upgrade.pull_latest_images")
-@mock.patch("quipucordsctl.commands.upgrade.install.run")
-@mock.patch("quipucordsctl.commands.upgrade.systemctl_utils.stop_service")
-def test_run_service_stop_fails(
-    mock_stop_service, mock_install_run, mock_pull_latest_images, caplog
-):
-    """Test upgrade.run early return when "stop" fails."""
-    caplog.set_level(logging.WARNING)
-    mock_stop_service.return_value = False
-    mock_args = argparse.Namespace()
-    mock_args.no_pull = False
-    mock_args.timeout = 0
-    mock_args.quiet = False
-    assert not upgrade.run(mock_args)
-    mock_install_run.assert_not_called()
-    mock_pull_latest_images.assert_not_called()
-
-
-@mock.patch("quipucordsctl.commands.upgrade.pull_latest_images")
-@mock.patch("quipucordsctl.commands.upgrade.install.run")
-@mock.patch("quipucordsctl.commands.upgrade.systemctl_utils.stop_service")
-def test_run_install_fails(
-    mock_stop_service, mock_install_run, mock_pull_latest_images, caplog
+@pytest.fixture
+def upgrade_mocks(mocker):
+    """Mock the steps upgrade.run drives so that they all succeed by default."""
+    return types.SimpleNamespace(
+        stop_service=mocker.patch.object(
+            upgrade.systemctl_utils, "stop_service", return_value=True
+        ),
+        install_run=mocker.patch.object(upgrade.install, "run", return_value=True),
+    )
+
+
+@pytest.fixture
+def mock_pull_latest_images(mocker):
+    """Mock pull_latest_images so that it succeeds by default."""
+    return mocker.patch.object(upgrade, "pull_latest_images", return_value=True)
+
+
+@pytest.fixture
+def make_args():
+    """Return a factory for upgrade args with defaults that tests may override."""
+    defaults = {"no_pull": False, "timeout": 0, "quiet": False}
+
+    def _make_args(**overrides):
+        return argparse.Namespace(**{**defaults, **overrides})
+
+    return _make_args
+
+
+@pytest.mark.parametrize(
+    "stop_result,install_result,overrides,expected_result,expected_log",
+    (
+        pytest.param(True, True, {}, True, None, id="happy-path"),
+        pytest.param(
+            True, True, {"no_pull": True}, True, "without pulling", id="no-pull"
+        ),
+        pytest.param(
+            False, True, {}, False, "failed to stop normally", id="stop-fails"
+        ),
+        pytest.param(
+            True, False, {}, False, "failed to install normally", id="install-fails"
+        ),
+    ),
+)
+def test_run(  # noqa: PLR0913
+    upgrade_mocks,
+    mock_pull_latest_images,
+    make_args,
+    caplog,
+    stop_result,
+    install_result,
+    overrides,
+    expected_result,
+    expected_log,
 ):
-    """Test upgrade.run early return when "install" fails."""
-    caplog.set_level(logging.ERROR)
-    mock_stop_service.return_value = True
-    mock_install_run.return_value = False
-    mock_args = argparse.Namespace()
-    mock_args.no_pull = False
-    mock_args.timeout = 0
-    mock_args.quiet = False
-    assert not upgrade.run(mock_args)
-    mock_pull_latest_images.assert_not_called()
-    assert "failed to install normally" in caplog.messages[-1]
+    """Test upgrade.run results for the stop, install, and pull steps."""
+    upgrade_mocks.stop_service.return_value = stop_result
+    upgrade_mocks.install_run.return_value = install_result
+    mock_args = make_args(**overrides)
+
+    with caplog.at_level(logging.WARNING, logger=upgrade.logger.name):
+        assert upgrade.run(mock_args) is expected_result
+
+    assert upgrade_mocks.install_run.called is stop_result
+    assert mock_pull_latest_images.called is (expected_result and not mock_args.no_pull)
+    if expected_log:
+        assert expected_log in caplog.messages[-1]
+    else:
+        assert caplog.record_tuples == []
 
 
 @mock.patch("quipucordsctl.commands.upgrade.podman_utils")
-@mock.patch("quipucordsctl.commands.upgrade.install.run")
-@mock.patch("quipucordsctl.commands.upgrade.systemctl_utils.stop_service")
 def test_run_podman_pull_fails(
-    mock_stop_service,
-    mock_install_run,
-    mock_podman_utils,
-    caplog,
-    faker,
+    mock_podman_utils, upgrade_mocks, make_args, caplog, placeholder
 ):
     """Test upgrade.run early return when "podman pull" fails."""
-    caplog.set_level(logging.ERROR)
-    mock_stop_service.return_value = True
-    mock_install_run.return_value = True
     mock_podman_utils.list_expected_podman_container_images.return_value = [
-        faker.slug() for _ in range(2)
+        placeholder() for _ in range(2)
     ]
-    mock_podman_utils.pull_image.side_effect = [False for _ in range(2)]
-    mock_args = argparse.Namespace()
-    mock_args.no_pull = False
-    mock_args.timeout = 0
-    mock_args.quiet = False
-    assert not upgrade.run(mock_args)
+    mock_podman_utils.pull_image.return_value = False
+    with caplog.at_level(logging.ERROR, logger=upgrade.logger.name):
+        assert not upgrade.run(make_args())
     assert "Failed to pull at least one image" in caplog.messages[-1]
+    # Pulling stops at the first failure instead of trying every image.
+    assert mock_podman_utils.pull_image.call_count == 1
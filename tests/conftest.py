@@ -1,14 +1,21 @@
 """Shared fixtures for pytest tests."""
 
-import importlib
+import argparse
+import itertools
+import logging
 import pathlib
-import pkgutil
-from collections.abc import Generator
+import types
+from collections.abc import Callable, Generator
 from typing import Any
 from unittest.mock import MagicMock
 
+import faker
 import pytest
 
+from quipucordsctl import settings
+
+_SETTINGS_DIR_NAMES = ("SERVER_DATA_DIR", "SERVER_ENV_DIR", "SYSTEMD_UNITS_DIR")
+
 
 def restore_permissions(target: pathlib.Path) -> None:
     """Restore potentially mangled permissions for pytest teardown cleanup."""
@@ -34,24 +41,10 @@ def temp_config_directories(
     tmp_path: pathlib.Path, monkeypatch
 ) -> Generator[dict[str, pathlib.Path], Any, None]:
     """Temporarily swap config directories for ALL commands that need them."""
-    temp_settings_dirs = {}
-
     # Create temp directories
-    for settings_dir in ("SERVER_DATA_DIR", "SERVER_ENV_DIR", "SYSTEMD_UNITS_DIR"):
-        new_path = tmp_path / settings_dir
-        temp_settings_dirs[settings_dir] = new_path
-
-    commands_package = importlib.import_module("quipucordsctl.commands")
-    command_names = [
-        module_info.name
-        for module_info in pkgutil.iter_modules(commands_package.__path__)
-    ]
-    for command in command_names:
-        for settings_dir in ("SERVER_DATA_DIR", "SERVER_ENV_DIR", "SYSTEMD_UNITS_DIR"):
-            monkeypatch.setattr(
-                f"quipucordsctl.commands.{command}.settings.{settings_dir}",
-                temp_settings_dirs[settings_dir],
-            )
+    temp_settings_dirs = {
+        settings_dir: tmp_path / settings_dir for settings_dir in _SETTINGS_DIR_NAMES
+    }
 
     # Handle SERVER_DATA_SUBDIRS (include 'certs' for maximum compatibility)
     tmp_data_dirs = {
@@ -59,11 +52,10 @@ def temp_config_directories(
         for data_dir in ("certs", "data", "db", "log", "sshkeys")  # Include all
     }
 
-    for command in command_names:
-        monkeypatch.setattr(
-            f"quipucordsctl.commands.{command}.settings.SERVER_DATA_SUBDIRS",
-            tmp_data_dirs,
-        )
+    # Every command imports this same settings module.
+    for settings_dir in _SETTINGS_DIR_NAMES:
+        monkeypatch.setattr(settings, settings_dir, temp_settings_dirs[settings_dir])
+    monkeypatch.setattr(settings, "SERVER_DATA_SUBDIRS", tmp_data_dirs)
 
     try:
         yield temp_settings_dirs
@@ -73,9 +65,41 @@ def temp_config_directories(
 
 
 @pytest.fixture
-def good_secret(faker):
+def error_log_level(caplog):
+    """Capture only ERROR and above unless a test asks for a lower level."""
+    caplog.set_level(logging.ERROR)
+
+
+@pytest.fixture
+def reset_args() -> argparse.Namespace:
+    """Return the default command-line arguments for running a reset command."""
+    return argparse.Namespace(prompt=False, quiet=False, yes=False)
+
+
+@pytest.fixture
+def placeholder() -> Callable[..., str]:
+    """Return a factory of distinct placeholder strings for values tests ignore."""
+    counter = itertools.count()
+
+    def _placeholder(prefix: str = "placeholder") -> str:
+        return f"{prefix}-{next(counter)}"
+
+    return _placeholder
+
+
+@pytest.fixture(scope="session")
+def session_faker() -> faker.Faker:
+    """Return a Faker instance for values generated once per test session."""
+    session_faker = faker.Faker()
+    # Match the Faker plugin's default seed so generated values are reproducible.
+    session_faker.seed_instance(0)
+    return session_faker
+
+
+@pytest.fixture(scope="session")
+def good_secret(session_faker):
     """Generate a "good" secret that should pass validation."""
-    return faker.password(
+    return session_faker.password(
         length=128,  # long enough for all intents and purposes
         special_chars=True,
         digits=True,
@@ -84,10 +108,10 @@ def good_secret(faker):
     )
 
 
-@pytest.fixture
-def bad_secret(faker):
+@pytest.fixture(scope="session")
+def bad_secret(session_faker):
     """Generate a "bad" secret that should fail validation."""
-    return faker.password(
+    return session_faker.password(
         length=4,  # definitely too short
         special_chars=True,
         digits=False,  # should have a number
@@ -111,6 +135,12 @@ def mock_first_time_run(mocker):
             "get_env",
             return_value=None,
         )
+        return types.SimpleNamespace(
+            generate_random_secret=mocker.patch.object(
+                reset_module.secrets, "generate_random_secret"
+            ),
+            set_secret=mocker.patch.object(reset_module.podman_utils, "set_secret"),
+        )
 
     return _mock_for_module
 
@@ -119,3 +149,17 @@ def assert_reset_command_help(reset_module, expected_keyword):
     """Assert that reset command has appropriate help text."""
     assert expected_keyword in reset_module.get_help()
     assert f"`{reset_module.__name__.split('.')[-1]}`" in reset_module.get_description()
+
+
+def assert_reset_command_is_set(reset_module, monkeypatch):
+    """Assert that reset command's is_set just wraps secret_exists."""
+    secret_exists_result = object()
+    checked_secret_names = []
+
+    def fake_secret_exists(secret_name):
+        checked_secret_names.append(secret_name)
+        return secret_exists_result
+
+    monkeypatch.setattr(reset_module.podman_utils, "secret_exists", fake_secret_exists)
+    assert reset_module.is_set() is secret_exists_result
+    assert checked_secret_names == [reset_module.PODMAN_SECRET_NAME]
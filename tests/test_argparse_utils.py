@@ -21,19 +21,19 @@ def test_non_negative_integer_invalid(value):
         argparse_utils.non_negative_integer(value)
 
 
-def test_add_command(faker):
+def test_add_command(placeholder):
     """Test add_command correctly adds to a specific action group for help display."""
     parser = argparse.ArgumentParser()
     subparsers = parser.add_subparsers()
-    parser.add_argument_group(faker.slug())  # extra to force checking multiple groups
-    middle_argument_group = parser.add_argument_group(faker.slug())
-    parser.add_argument_group(faker.slug())  # extra to force checking multiple groups
+    parser.add_argument_group(placeholder())  # extra to force checking multiple groups
+    middle_argument_group = parser.add_argument_group(placeholder())
+    parser.add_argument_group(placeholder())  # extra to force checking multiple groups
 
     mock_command = mock.Mock(spec=["setup_parser"])
-    command_name = faker.slug()
-    command_help = faker.sentence()
-    command_description = faker.sentence()
-    command_epilog = faker.sentence()
+    command_name = placeholder()
+    command_help = placeholder()
+    command_description = placeholder()
+    command_epilog = placeholder()
 
     argparse_utils.add_command(
         subparsers,
@@ -45,20 +45,12 @@ def test_add_command(faker):
         command_epilog,
     )
 
-    argparse_group = next(
-        filter(
-            lambda _group: _group.title == middle_argument_group.title,
-            parser._action_groups,
-        )
-    )
-    action = next(
-        filter(
-            lambda _action: _action.dest == command_name,
-            argparse_group._group_actions,
-        )
-    )
-    # If action is found in the filtered action group, then it was added as expected.
-    # This is an implicit assertion by virtue of the "next"s not raising StopIteration.
+    groups_by_title = {group.title: group for group in parser._action_groups}
+    argparse_group = groups_by_title[middle_argument_group.title]
+    actions_by_dest = {action.dest: action for action in argparse_group._group_actions}
+    action = actions_by_dest[command_name]
+    # If action is found in the expected action group, then it was added as expected.
+    # This is an implicit assertion by virtue of the lookups not raising KeyError.
 
     mock_command.setup_parser.assert_called_once()
     assert action.dest == command_name
@@ -67,18 +59,18 @@ def test_add_command(faker):
     assert subparsers.choices[command_name].epilog == command_epilog
 
 
-def test_add_command_hidden(faker):
+def test_add_command_hidden(placeholder):
     """Test add_command with HIDDEN_COMMAND=True suppresses help text."""
     parser = argparse.ArgumentParser()
     subparsers = parser.add_subparsers()
-    middle_argument_group = parser.add_argument_group(faker.slug())
+    middle_argument_group = parser.add_argument_group(placeholder())
 
     mock_command = mock.Mock(spec=["setup_parser"])
     mock_command.HIDDEN_COMMAND = True
-    command_name = faker.slug()
-    command_help = faker.sentence()
-    command_description = faker.sentence()
-    command_epilog = faker.sentence()
+    command_name = placeholder()
+    command_help = placeholder()
+    command_description = placeholder()
+    command_epilog = placeholder()
 
     argparse_utils.add_command(
         subparsers,
@@ -90,18 +82,10 @@ def test_add_command_hidden(faker):
         command_epilog,
     )
 
-    argparse_group = next(
-        filter(
-            lambda _group: _group.title == middle_argument_group.title,
-            parser._action_groups,
-        )
-    )
-    action = next(
-        filter(
-            lambda _action: _action.dest == command_name,
-            argparse_group._group_actions,
-        )
-    )
+    groups_by_title = {group.title: group for group in parser._action_groups}
+    argparse_group = groups_by_title[middle_argument_group.title]
+    actions_by_dest = {action.dest: action for action in argparse_group._group_actions}
+    action = actions_by_dest[command_name]
 
     mock_command.setup_parser.assert_called_once()
     assert action.dest == command_name
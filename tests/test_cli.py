@@ -1,6 +1,8 @@
 """Test the cli module."""
 
+import argparse
 import logging
+import types
 from unittest import mock
 from unittest.mock import MagicMock
 
@@ -8,6 +10,16 @@ import pytest
 
 from quipucordsctl import argparse_utils, cli
 
+# Ordered from most to least severe, so prefixes are the levels shown at a threshold.
+_LEVEL_MESSAGES = {
+    logging.CRITICAL: "critical message",
+    logging.ERROR: "error message",
+    logging.WARNING: "warning message",
+    logging.INFO: "info message",
+    logging.DEBUG: "debug message",
+}
+_LOG_LEVELS = tuple(_LEVEL_MESSAGES)
+
 
 def test_load_commands():
     """Test some known commands are loaded and returned."""
@@ -23,10 +35,10 @@ def test_load_commands():
     assert "__init__" not in commands
 
 
-def test_create_parser_and_parse(faker):
+def test_create_parser_and_parse(placeholder):
     """Test the constructed argument parser."""
-    mock_command_name = faker.slug()
-    mock_command_doc = faker.sentence()
+    mock_command_name = placeholder()
+    mock_command_doc = placeholder()
     mock_command = mock.Mock()
     mock_command.__doc__ = mock_command_doc
     mock_command.get_display_group = mock.Mock(
@@ -36,20 +48,12 @@ def test_create_parser_and_parse(faker):
     parser = cli.create_parser({mock_command_name: mock_command})
 
     # Check that the mock_command was created under the "other" group.
-    argparse_group = next(
-        filter(
-            lambda _group: _group.title == argparse_utils.DisplayGroups.OTHER.value,
-            parser._action_groups,
-        )
-    )
-    action = next(
-        filter(
-            lambda _action: _action.dest == mock_command_name,
-            argparse_group._group_actions,
-        )
-    )
+    groups_by_title = {group.title: group for group in parser._action_groups}
+    argparse_group = groups_by_title[argparse_utils.DisplayGroups.OTHER.value]
+    actions_by_dest = {action.dest: action for action in argparse_group._group_actions}
+    action = actions_by_dest[mock_command_name]
     assert action is not None
-    # If action exists in the filtered group, then it was added correctly.
+    # If action exists in the expected group, then it was added correctly.
 
     # Simplest no-arg invocation.
     parsed_args = parser.parse_args([])
@@ -75,78 +79,54 @@ def test_create_parser_and_parse(faker):
             # default "no argument" use case
             0,
             False,
-            [logging.CRITICAL, logging.ERROR, logging.WARNING],
+            _LOG_LEVELS[:3],
         ],
         [
             # single "-v" argument
             1,
             False,
-            [logging.CRITICAL, logging.ERROR, logging.WARNING, logging.INFO],
+            _LOG_LEVELS[:4],
         ],
         [
             # two "-v" arguments
             2,
             False,
-            [
-                logging.CRITICAL,
-                logging.ERROR,
-                logging.WARNING,
-                logging.INFO,
-                logging.DEBUG,
-            ],
+            _LOG_LEVELS,
         ],
         [
             # three "-v" arguments
             3,
             False,
-            [
-                logging.CRITICAL,
-                logging.ERROR,
-                logging.WARNING,
-                logging.INFO,
-                logging.DEBUG,
-            ],
+            _LOG_LEVELS,
         ],
         [
             # no "-v" arguments and a "-q" argument
             0,
             True,
-            [logging.CRITICAL],
+            _LOG_LEVELS[:1],
         ],
         [
             # 420 "-v" arguments and a "-q" argument
             # quiet has higher priority than verbose
             420,
             True,
-            [logging.CRITICAL],
+            _LOG_LEVELS[:1],
         ],
     ],
 )
 def test_configure_logging(
-    verbosity: int, quiet: bool, expected_log_levels: list[int], caplog
+    verbosity: int, quiet: bool, expected_log_levels: tuple[int, ...], caplog
 ):
     """Test configure_logging sets appropriate log levels."""
     level = cli.configure_log_level(verbosity, quiet)
 
-    messages = {
-        logging.CRITICAL: "critical message",
-        logging.ERROR: "error message",
-        logging.WARNING: "warning message",
-        logging.INFO: "info message",
-        logging.DEBUG: "debug message",
-    }
-
     with caplog.at_level(level):
-        for level, message in messages.items():
+        for level, message in _LEVEL_MESSAGES.items():
             logging.log(level, message)
 
-        assert len(caplog.messages) == len(expected_log_levels)
-
-        for level, message in messages.items():
-            if level in expected_log_levels:
-                assert message in caplog.messages
-            else:
-                assert message not in caplog.messages
+        assert caplog.messages == [
+            _LEVEL_MESSAGES[level] for level in expected_log_levels
+        ]
 
 
 def test_cli_without_command():
@@ -164,28 +144,29 @@ def test_cli_without_command():
         mock_parser.print_help.assert_called_once()
 
 
-def test_cli_nonzero_exit_when_command_fails():
-    """Test cli.run exits with non-zero exit code when the command fails."""
+@pytest.fixture
+def failing_run():
+    """Patch cli.run to dispatch to a mock command, with cli.sys mocked."""
+    command_name = "failure"
+    command = MagicMock()
+    args = argparse.Namespace(
+        command=command_name, verbosity=0, quiet=False, yes=False, color="never"
+    )
     with (
         mock.patch.object(cli, "create_parser") as mock_create_parser,
-        mock.patch.object(cli, "load_commands") as mock_load_commands,
+        mock.patch.object(cli, "load_commands", return_value={command_name: command}),
         mock.patch.object(cli, "sys") as mock_sys,
     ):
-        command_name = "failure"
+        mock_create_parser.return_value.parse_args.return_value = args
+        yield types.SimpleNamespace(command=command, sys=mock_sys)
 
-        mock_parser = mock_create_parser.return_value
-        mock_args = mock_parser.parse_args.return_value
-        mock_args.command = command_name
-        mock_args.verbosity = 0  # need any int because MagicMock is not int-like
-        mock_args.yes = False
-        mock_args.quiet = False
 
-        mock_command = MagicMock()
-        mock_command.run.return_value = False
-        mock_load_commands.return_value = {command_name: mock_command}
+def test_cli_nonzero_exit_when_command_fails(failing_run):
+    """Test cli.run exits with non-zero exit code when the command fails."""
+    failing_run.command.run.return_value = False
 
-        cli.run()
-        mock_sys.exit.assert_called_once_with(1)
+    cli.run()
+    failing_run.sys.exit.assert_called_once_with(1)
 
 
 @pytest.mark.parametrize(
@@ -197,33 +178,16 @@ def test_cli_nonzero_exit_when_command_fails():
     ],
 )
 def test_cli_nonzero_exit_when_command_raises_exception(
-    exception, error_message, caplog
+    exception, error_message, failing_run, caplog
 ):
     """Test cli.run exits with non-zero exit code following an exception."""
-    with (
-        mock.patch.object(cli, "create_parser") as mock_create_parser,
-        mock.patch.object(cli, "load_commands") as mock_load_commands,
-        mock.patch.object(cli, "sys") as mock_sys,
-        caplog.at_level(logging.ERROR),
-    ):
-        command_name = "failure"
-
-        mock_parser = mock_create_parser.return_value
-        mock_args = mock_parser.parse_args.return_value
-        mock_args.command = command_name
-        mock_args.verbosity = 0  # need any int because MagicMock is not int-like
-        mock_args.yes = False
-        mock_args.quiet = False
-        mock_args.color = "never"
-
-        mock_command = MagicMock()
-        mock_command.run.side_effect = exception
-        mock_load_commands.return_value = {command_name: mock_command}
+    failing_run.command.run.side_effect = exception
 
+    with caplog.at_level(logging.ERROR):
         cli.run()
-        mock_sys.exit.assert_called_once_with(1)
+    failing_run.sys.exit.assert_called_once_with(1)
 
-        assert caplog.messages == [error_message]
+    assert caplog.messages == [error_message]
 
 
 @pytest.mark.parametrize(
@@ -251,115 +215,64 @@ def test_should_use_color(color_choice, no_color_env, isatty, expected, monkeypa
     assert cli.should_use_color(color_choice, fake_stream) is expected
 
 
-def test_ctlloggingformatter_format(faker):
-    """Test cli.ctlloggingformatter format with color enabled and high verbosity."""
-    datefmt = faker.slug()  # predictable placeholder since datetime changes quickly
-    formatter = cli.CtlLoggingFormatter(use_color=True, verbosity=3, datefmt=datefmt)
-    message = faker.sentence()
-    record = logging.LogRecord(
-        name="my_logger",
-        level=logging.DEBUG,
-        pathname=faker.slug(),
-        lineno=faker.pyint(),
-        msg=message,
-        args=[],
-        exc_info=None,
-    )
-    expected = (
-        f"{formatter.LEVEL_STYLES[logging.DEBUG]}"
-        f"{datefmt} DEBUG: {message}{formatter.RESET}"
-    )
-    assert formatter.format(record) == expected
-
-
-def test_ctlloggingformatter_format_no_color(faker):
-    """Test cli.ctlloggingformatter format with color disabled."""
-    datefmt = faker.slug()  # predictable placeholder since datetime changes quickly
-    formatter = cli.CtlLoggingFormatter(use_color=False, verbosity=3, datefmt=datefmt)
-    message = faker.sentence()
-    record = logging.LogRecord(
-        name="my_logger",
-        level=logging.DEBUG,
-        pathname=faker.slug(),
-        lineno=faker.pyint(),
-        msg=message,
-        args=[],
-        exc_info=None,
-    )
-    expected = f"{datefmt} DEBUG: {message}"
-    assert formatter.format(record) == expected
-
-
-def test_ctlloggingformatter_format_no_verbosity(faker):
-    """Test cli.ctlloggingformatter format with color enabled but no verbosity."""
+@pytest.mark.parametrize(
+    "use_color,verbosity,level,with_date,with_style",
+    (
+        pytest.param(True, 3, logging.DEBUG, True, True, id="color-verbose"),
+        pytest.param(False, 3, logging.DEBUG, True, False, id="no-color"),
+        pytest.param(True, 0, logging.DEBUG, False, True, id="no-verbosity"),
+        pytest.param(True, 0, logging.NOTSET, False, False, id="unsupported-level"),
+    ),
+)
+def test_ctlloggingformatter_format(  # noqa: PLR0913
+    use_color, verbosity, level, with_date, with_style, placeholder
+):
+    """Test cli.ctlloggingformatter format with varying color, verbosity, and level."""
+    datefmt = placeholder()  # predictable placeholder since datetime changes quickly
     formatter = cli.CtlLoggingFormatter(
-        use_color=True, verbosity=0, datefmt=faker.slug()
+        use_color=use_color, verbosity=verbosity, datefmt=datefmt
     )
-    message = faker.sentence()
+    message = placeholder()
     record = logging.LogRecord(
         name="my_logger",
-        level=logging.DEBUG,
-        pathname=faker.slug(),
-        lineno=faker.pyint(),
+        level=level,
+        pathname=placeholder(),
+        lineno=1,
         msg=message,
         args=[],
         exc_info=None,
     )
-    expected = (
-        f"{formatter.LEVEL_STYLES[logging.DEBUG]}DEBUG: {message}{formatter.RESET}"
-    )
-    assert formatter.format(record) == expected
-
 
-def test_ctlloggingformatter_format_unsupported_level(faker):
-    """Test cli.ctlloggingformatter format with unsupported level."""
-    formatter = cli.CtlLoggingFormatter(
-        use_color=True, verbosity=0, datefmt=faker.slug()
-    )
-    message = faker.sentence()
-    record = logging.LogRecord(
-        name="my_logger",
-        level=logging.NOTSET,
-        pathname=faker.slug(),
-        lineno=faker.pyint(),
-        msg=message,
-        args=[],
-        exc_info=None,
-    )
-    expected = f"NOTSET: {message}"
+    expected = f"{logging.getLevelName(level)}: {message}"
+    if with_date:
+        expected = f"{datefmt} {expected}"
+    if with_style:
+        expected = f"{formatter.LEVEL_STYLES[level]}{expected}{formatter.RESET}"
     assert formatter.format(record) == expected
 
 
-def test_install_console_handler(caplog):
+def test_install_console_handler(monkeypatch):
     """Test cli.install_console_handler adds the expected handler."""
-    caplog.set_level(logging.DEBUG)
-    with mock.patch.object(cli, "logging") as mock_logging:
-        mock_root_logger = mock_logging.getLogger.return_value
-        mock_root_logger.handlers = []
-        mock_handler = mock_logging.StreamHandler.return_value
-
-        cli.install_console_handler(verbosity=0, color="never")
+    root_logger = logging.getLogger()
+    # Start from no handlers; monkeypatch restores the real list afterwards.
+    monkeypatch.setattr(root_logger, "handlers", [])
 
-        mock_root_logger.addHandler.assert_called_once()
-        mock_handler.setFormatter.assert_called_once()
-        assert mock_handler == mock_root_logger.addHandler.call_args[0][0]
-        formatter = mock_handler.setFormatter.call_args[0][0]
-        assert isinstance(formatter, cli.CtlLoggingFormatter)
-        assert formatter.use_color is False
+    cli.install_console_handler(verbosity=0, color="never")
 
-    assert caplog.messages == []
+    (handler,) = root_logger.handlers
+    assert isinstance(handler, logging.StreamHandler)
+    assert isinstance(handler.formatter, cli.CtlLoggingFormatter)
+    assert handler.formatter.use_color is False
 
 
-def test_install_console_handler_skips_if_any_handler_exists(caplog):
+def test_install_console_handler_skips_if_any_handler_exists(caplog, monkeypatch):
     """Test cli.install_console_handler skips if any handler is already installed."""
     caplog.set_level(logging.WARNING)
-    with mock.patch.object(cli, "logging") as mock_logging:
-        mock_root_logger = mock_logging.getLogger.return_value
-        mock_root_logger.handlers = [mock.Mock()]
-        mock_logging.StreamHandler = mock.Mock
-
-        cli.install_console_handler(verbosity=0, color="never")
+    root_logger = logging.getLogger()
+    # caplog's own handler is a StreamHandler, so it stands in as the existing one.
+    monkeypatch.setattr(root_logger, "handlers", [caplog.handler])
 
-        mock_root_logger.addHandler.assert_not_called()
+    cli.install_console_handler(verbosity=0, color="never")
 
+    assert root_logger.handlers == [caplog.handler]
     assert caplog.messages == ["Cannot install log handler due to existing handler."]
@@ -1,27 +1,32 @@
 """Test the quipucords.__main__ entrypoint module."""
 
-from unittest import mock
+import types
 
 from quipucordsctl import __main__
 
 
-@mock.patch.object(__main__, "gettext")
-@mock.patch.object(__main__, "pkg_resources")
-def test_set_up_gettext(mock_pkg_resources, mock_gettext):
+def test_set_up_gettext(monkeypatch, tmp_path):
     """Test set_up_gettext expected behavior."""
-    base_path = mock_pkg_resources.files.return_value
-    locale_path = mock.Mock()
-    base_path.joinpath.return_value = locale_path
+    monkeypatch.setattr(
+        __main__,
+        "pkg_resources",
+        types.SimpleNamespace(files={"quipucordsctl": tmp_path}.__getitem__),
+    )
+    bound_domains = []
 
-    __main__.set_up_gettext()
+    def record_bindtextdomain(domain, localedir):
+        bound_domains.append((domain, localedir))
 
-    base_path.joinpath.assert_called_once_with("locale")
-    mock_gettext.bindtextdomain.assert_called_once_with(
-        "messages", localedir=str(locale_path)
+    monkeypatch.setattr(
+        __main__, "gettext", types.SimpleNamespace(bindtextdomain=record_bindtextdomain)
     )
 
+    __main__.set_up_gettext()
+
+    assert bound_domains == [("messages", str(tmp_path / "locale"))]
 
-def test_main_invokes_other_setup_and_cli_run(mocker):
+
+def test_main_invokes_other_setup_and_cli_run(monkeypatch):
     """Test the main entrypoint function."""
     # Important note! We must locally reimport __main__ inside this test
     # function to avoid a situation where other tests may have already
@@ -29,10 +34,21 @@ def test_main_invokes_other_setup_and_cli_run(mocker):
     # internal imported modules cache which is difficult to patch.
     import quipucordsctl.__main__ as main_module  # noqa: PLC0415
 
-    mock_other_setup = mocker.patch.object(main_module, "set_up_gettext")
-    mock_run = mocker.patch("quipucordsctl.cli.run")
+    calls = []
+
+    def record_set_up_gettext():
+        calls.append(("set_up_gettext", {}))
+
+    def record_run(**kwargs):
+        calls.append(("run", kwargs))
+
+    monkeypatch.setattr(main_module, "set_up_gettext", record_set_up_gettext)
+    monkeypatch.setattr("quipucordsctl.cli.run", record_run)
 
     main_module.main()
 
-    mock_other_setup.assert_called_once_with()
-    mock_run.assert_called_once_with(install_logging_handlers=True)
+    # gettext must be set up before cli runs.
+    assert calls == [
+        ("set_up_gettext", {}),
+        ("run", {"install_logging_handlers": True}),
+    ]
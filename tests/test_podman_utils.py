@@ -3,6 +3,7 @@
 import logging
 import pathlib
 import subprocess
+import types
 from unittest import mock
 
 import pytest
@@ -16,80 +17,79 @@ def test_ensure_cgroups_v2_happy_path(mock_run_command, capsys):
     mock_run_command.return_value = '{"host": {"cgroupVersion": "v2"}}', None, 0
 
     podman_utils.ensure_cgroups_v2()
-    assert capsys.readouterr().out == ""
-    assert capsys.readouterr().err == ""
     # Nothing else to assert; simply expect no output and no exceptions.
+    assert capsys.readouterr() == ("", "")
 
 
+@pytest.mark.parametrize(
+    "podman_info_result,expected_out",
+    (
+        pytest.param(
+            ('{"host": {"cgroupVersion": "v1"}}', None, 0),
+            podman_utils.ENABLE_CGROUPS_V2_LONG_MESSAGE
+            % {"server_software_name": settings.SERVER_SOFTWARE_NAME}
+            + "\n",
+            id="not-v2",  # RHEL8 default
+        ),
+        pytest.param(('oh my potatoes\n\n""&;', None, 0), "", id="not-json"),
+        pytest.param(("", None, 1), "", id="podman-info-failed"),
+    ),
+)
 @mock.patch.object(podman_utils.shell_utils, "run_command")
-def test_ensure_cgroups_v2_is_not_v2(mock_run_command, capsys):
-    """Test ensure_cgroups_v2 when cgroups v2 is not enabled (RHEL8 default)."""
-    mock_run_command.return_value = '{"host": {"cgroupVersion": "v1"}}', None, 0
+def test_ensure_cgroups_v2_not_ready(
+    mock_run_command, podman_info_result, expected_out, capsys
+):
+    """Test ensure_cgroups_v2 raises when cgroups v2 cannot be confirmed."""
+    mock_run_command.return_value = podman_info_result
 
     with pytest.raises(podman_utils.PodmanIsNotReadyError):
         podman_utils.ensure_cgroups_v2()
-    assert (
-        podman_utils.ENABLE_CGROUPS_V2_LONG_MESSAGE
-        % {"server_software_name": settings.SERVER_SOFTWARE_NAME}
-        in capsys.readouterr().out
-    )
-    assert capsys.readouterr().err == ""
+    assert capsys.readouterr() == (expected_out, "")
 
 
-@mock.patch.object(podman_utils.shell_utils, "run_command")
-def test_ensure_cgroups_v2_fails_to_read_json(mock_run_command, capsys):
-    """Test ensure_cgroups_v2 when podman info fails to return JSON."""
-    mock_run_command.return_value = 'oh my potatoes\n\n""&;', None, 0
+@pytest.fixture
+def set_platform(monkeypatch):
+    """Return a function that sets the sys.platform seen by podman_utils."""
 
-    with pytest.raises(podman_utils.PodmanIsNotReadyError):
-        podman_utils.ensure_cgroups_v2()
-    assert capsys.readouterr().out == ""
-    assert capsys.readouterr().err == ""
+    def _set_platform(platform: str):
+        monkeypatch.setattr(
+            podman_utils, "sys", types.SimpleNamespace(platform=platform)
+        )
 
+    return _set_platform
 
-@mock.patch.object(podman_utils.shell_utils, "run_command")
-def test_ensure_cgroups_v2_failed(mock_run_command, capsys):
-    """Test ensure_cgroups_v2 when podman info fails unexpectedly."""
-    mock_run_command.return_value = "", None, 1
-
-    with pytest.raises(podman_utils.PodmanIsNotReadyError):
-        podman_utils.ensure_cgroups_v2()
-    assert capsys.readouterr().out == ""
-    assert capsys.readouterr().err == ""
 
-
-@mock.patch.object(podman_utils, "sys")
-@mock.patch.object(podman_utils, "os")
-def test_get_socket_path_linux_default(mock_os, mock_sys, tmp_path, faker):
+def test_get_socket_path_linux_default(set_platform, monkeypatch, faker):
     """Test get_socket_path uses /run/user/uid on Linux by default."""
-    mock_sys.platform = "linux"
-    mock_os.environ.get.return_value = None
+    set_platform("linux")
     uid = faker.pyint()
-    mock_os.getuid.return_value = uid
+    monkeypatch.setattr(
+        podman_utils, "os", types.SimpleNamespace(environ={}, getuid=lambda: uid)
+    )
     expected_socket_path = pathlib.Path(f"/run/user/{uid}/podman/podman.sock")
     assert podman_utils.get_socket_path() == expected_socket_path
 
 
-@mock.patch.object(podman_utils, "sys")
-@mock.patch.object(podman_utils, "os")
-def test_get_socket_path_linux_with_xdg_env_var(mock_os, mock_sys, tmp_path):
+def test_get_socket_path_linux_with_xdg_env_var(set_platform, monkeypatch, tmp_path):
     """Test get_socket_path uses XDG_RUNTIME_DIR on Linux if set."""
-    mock_sys.platform = "linux"
-    mock_os.environ.get.return_value = str(tmp_path)
+    set_platform("linux")
+    monkeypatch.setattr(
+        podman_utils,
+        "os",
+        types.SimpleNamespace(environ={"XDG_RUNTIME_DIR": str(tmp_path)}),
+    )
     expected_socket_path = pathlib.Path(tmp_path / "podman" / "podman.sock")
     assert podman_utils.get_socket_path() == expected_socket_path
-    mock_os.environ.get.assert_called_once_with("XDG_RUNTIME_DIR")
 
 
-@mock.patch.object(podman_utils, "sys")
-def test_get_socket_path_macos_darwin(mock_sys, tmp_path):
+def test_get_socket_path_macos_darwin(set_platform, monkeypatch, tmp_path):
     """Test get_socket_path uses MACOS_DEFAULT_PODMAN_URL on macOS by default."""
-    mock_sys.platform = "darwin"
+    set_platform("darwin")
     expected_socket_path = pathlib.Path(tmp_path / "podman.sock")
-    with mock.patch.object(
-        podman_utils, "MACOS_DEFAULT_PODMAN_URL", new=str(expected_socket_path)
-    ):
-        assert podman_utils.get_socket_path() == expected_socket_path
+    monkeypatch.setattr(
+        podman_utils, "MACOS_DEFAULT_PODMAN_URL", str(expected_socket_path)
+    )
+    assert podman_utils.get_socket_path() == expected_socket_path
 
 
 def test_get_socket_path_uses_base_url_if_given(tmp_path):
@@ -99,119 +99,77 @@ def test_get_socket_path_uses_base_url_if_given(tmp_path):
     assert podman_utils.get_socket_path(base_url) == expected_socket_path
 
 
-@mock.patch.object(podman_utils, "sys")
-@mock.patch.object(podman_utils, "shell_utils")
+@mock.patch.object(podman_utils.shell_utils, "run_command")
 @mock.patch.object(podman_utils, "get_socket_path")
 def test_ensure_podman_socket_linux(
-    mock_get_socket_path, mock_shell_utils, mock_sys, tmp_path
+    mock_get_socket_path, mock_run_command, set_platform, tmp_path
 ):
     """Test ensure_podman_socket succeeds on Linux with working podman.socket."""
-    mock_sys.platform = "linux"
+    set_platform("linux")
     socket_path = pathlib.Path(tmp_path / "podman.sock")
     socket_path.touch()
     mock_get_socket_path.return_value = socket_path
-    mock_shell_utils.run_command.side_effect = [("", "", 0), ("", "", 0)]
+    mock_run_command.side_effect = [("", "", 0), ("", "", 0)]
 
     podman_utils.ensure_podman_socket(str(socket_path))
-    assert len(mock_shell_utils.run_command.call_args_list) == 2
-    assert mock_shell_utils.run_command.call_args_list[0].args[0] == (
-        ["systemctl", "--user", "enable", "--now", "podman.socket"]
-    )
-    assert mock_shell_utils.run_command.call_args_list[1].args[0] == (
-        ["systemctl", "--user", "status", "podman.socket"]
-    )
+    assert mock_run_command.call_args_list == [
+        mock.call(["systemctl", "--user", "enable", "--now", "podman.socket"]),
+        mock.call(["systemctl", "--user", "status", "podman.socket"]),
+    ]
 
 
-@mock.patch.object(podman_utils, "sys")
-@mock.patch.object(podman_utils, "shell_utils")
+@mock.patch.object(podman_utils.shell_utils, "run_command")
 @mock.patch.object(podman_utils, "get_socket_path")
 def test_ensure_podman_socket_linux_broken_podman(
-    mock_get_socket_path, mock_shell_utils, mock_sys, tmp_path
+    mock_get_socket_path, mock_run_command, set_platform
 ):
     """Test ensure_podman_socket failure when Linux has broken podman.socket."""
-    mock_sys.platform = "linux"
-    mock_shell_utils.run_command.side_effect = Exception
+    set_platform("linux")
+    mock_run_command.side_effect = Exception
 
     with pytest.raises(Exception):
         podman_utils.ensure_podman_socket()
 
-    mock_shell_utils.run_command.assert_called_once_with(
+    mock_run_command.assert_called_once_with(
         ["systemctl", "--user", "enable", "--now", "podman.socket"]
     )
     mock_get_socket_path.assert_not_called()
 
 
-@mock.patch.object(podman_utils, "sys")
-@mock.patch.object(podman_utils, "shell_utils")
-def test_ensure_podman_socket_macos(mock_shell_utils, mock_sys, tmp_path):
-    """Test ensure_podman_socket succeeds when podman is enabled on macOS/darwin."""
-    mock_sys.platform = "darwin"
-    mock_shell_utils.run_command.side_effect = [("running", "", 0)]
+@pytest.mark.parametrize(
+    "inspect_result,error_message",
+    (
+        pytest.param(("running", "", 0), None, id="running"),
+        pytest.param(("stopped", "", 0), "machine is not running", id="not-running"),
+        pytest.param((None, None, 1), "failed unexpectedly", id="broken"),
+    ),
+)
+@mock.patch.object(podman_utils.shell_utils, "run_command")
+def test_ensure_podman_socket_macos(  # noqa: PLR0913
+    mock_run_command, inspect_result, error_message, set_platform, monkeypatch, tmp_path
+):
+    """Test ensure_podman_socket checks the podman machine state on macOS/darwin."""
+    set_platform("darwin")
+    mock_run_command.return_value = inspect_result
     mock_path = pathlib.Path(tmp_path / "podman.sock")
     mock_path.touch()
+    monkeypatch.setattr(podman_utils, "MACOS_DEFAULT_PODMAN_URL", str(mock_path))
 
-    with mock.patch.object(
-        podman_utils, "MACOS_DEFAULT_PODMAN_URL", new=str(mock_path)
-    ):
+    if error_message is None:
         podman_utils.ensure_podman_socket()
-
-    mock_shell_utils.run_command.assert_called_once_with(
-        ["podman", "machine", "inspect", "--format", "{{.State}}"], raise_error=False
-    )
-
-
-@mock.patch.object(podman_utils, "sys")
-@mock.patch.object(podman_utils, "shell_utils")
-def test_ensure_podman_socket_macos_not_running(mock_shell_utils, mock_sys, tmp_path):
-    """Test ensure_podman_socket when podman machine is not running on macOS/darwin."""
-    mock_sys.platform = "darwin"
-    mock_shell_utils.run_command.side_effect = [("stopped", "", 0)]
-    mock_path = pathlib.Path(tmp_path / "podman.sock")
-    mock_path.touch()
-
-    with (
-        mock.patch.object(podman_utils, "MACOS_DEFAULT_PODMAN_URL", new=str(mock_path)),
-        pytest.raises(podman_utils.PodmanIsNotReadyError),
-    ):
-        try:
-            podman_utils.ensure_podman_socket()
-        except podman_utils.PodmanIsNotReadyError as e:
-            assert "machine is not running" in e.args[0]
-            raise e
-
-    mock_shell_utils.run_command.assert_called_once_with(
-        ["podman", "machine", "inspect", "--format", "{{.State}}"], raise_error=False
-    )
-
-
-@mock.patch.object(podman_utils, "sys")
-@mock.patch.object(podman_utils, "shell_utils")
-def test_ensure_podman_socket_macos_broken(mock_shell_utils, mock_sys, tmp_path):
-    """Test ensure_podman_socket when podman command is broken on macOS/darwin."""
-    mock_sys.platform = "darwin"
-    mock_shell_utils.run_command.return_value = None, None, 1
-    mock_path = pathlib.Path(tmp_path / "podman.sock")
-    mock_path.touch()
-
-    with (
-        mock.patch.object(podman_utils, "MACOS_DEFAULT_PODMAN_URL", new=str(mock_path)),
-        pytest.raises(podman_utils.PodmanIsNotReadyError),
-    ):
-        try:
+    else:
+        with pytest.raises(podman_utils.PodmanIsNotReadyError, match=error_message):
             podman_utils.ensure_podman_socket()
-        except podman_utils.PodmanIsNotReadyError as e:
-            assert "failed unexpectedly" in e.args[0]
-            raise e
 
-    mock_shell_utils.run_command.assert_called_once_with(
+    mock_run_command.assert_called_once_with(
         ["podman", "machine", "inspect", "--format", "{{.State}}"], raise_error=False
     )
 
 
 @mock.patch.object(podman_utils.shell_utils, "run_command")
-def test_secret_exists(mock_run_command, faker):
+def test_secret_exists(mock_run_command, placeholder):
     """Test secret_exists simply checks the podman CLI's return code."""
-    secret_name = faker.slug()
+    secret_name = placeholder("secret")
     mock_run_command.side_effect = [
         [None, None, 0],  # manual testing confirmed '0' is podman's "yes" code
         [None, None, 1],  # manual testing confirmed '1' is podman's "no" code
@@ -223,80 +181,98 @@ def test_secret_exists(mock_run_command, faker):
     assert podman_utils.secret_exists(secret_name)
 
 
+@pytest.mark.parametrize(
+    "run_command_results,allow_replace,expected_return,expected_messages",
+    (
+        pytest.param(
+            [
+                [None, None, 1],  # "exists" command (no, does not exist)
+                [None, None, 0],  # "create" command success
+            ],
+            True,
+            True,
+            [
+                "Podman secret '{secret_name}' does not exist.",
+                "Podman secret '{secret_name}' was set.",
+            ],
+            id="new",
+        ),
+        pytest.param(
+            [
+                [None, None, 0],  # "exists" command (yes, does exist)
+                [None, None, 0],  # "delete" command success
+                [None, None, 0],  # "create" command success
+            ],
+            True,
+            True,
+            [
+                "Podman secret '{secret_name}' exists.",
+                "Podman secret '{secret_name}' already exists before setting a new "
+                "value.",
+                "Podman secret '{secret_name}' was removed.",
+                "Podman secret '{secret_name}' was set.",
+            ],
+            id="exists-and-replace",
+        ),
+        pytest.param(
+            [
+                [None, None, 0],  # "exists" command (yes, does exist)
+                # no other commands expected
+            ],
+            False,
+            False,
+            [
+                "Podman secret '{secret_name}' exists.",
+                "Podman secret '{secret_name}' already exists before setting a new "
+                "value.",
+            ],
+            id="exists-but-no-replace",
+        ),
+        pytest.param(
+            [
+                [None, None, 1],  # "exists" command (no, does not exist)
+                [None, None, 1],  # "create" failed unexpectedly
+            ],
+            True,
+            False,
+            [
+                "Podman secret '{secret_name}' does not exist.",
+                "Podman failed to set secret '{secret_name}'.",
+            ],
+            id="create-failed",
+        ),
+    ),
+)
 @mock.patch.object(podman_utils.shell_utils, "run_command")
-def test_set_secret(mock_run_command, good_secret, faker, caplog):
-    """Test the set_secret function sets a new secret."""
-    caplog.set_level(logging.DEBUG)
-    secret_name = faker.slug()
-    mock_run_command.side_effect = [
-        [None, None, 1],  # "exists" command (no, does not exist)
-        [None, None, 0],  # "create" command success
-    ]
-
-    assert podman_utils.set_secret(secret_name, good_secret)
-    assert f"Podman secret '{secret_name}' was set." == caplog.messages[-1]
-
-
-@mock.patch.object(podman_utils.shell_utils, "run_command")
-def test_set_secret_exists_and_yes_replace(mock_run_command, faker, caplog):
-    """Test the set_secret function replaces existing secret."""
+def test_set_secret(  # noqa: PLR0913
+    mock_run_command,
+    run_command_results,
+    allow_replace,
+    expected_return,
+    expected_messages,
+    placeholder,
+    caplog,
+):
+    """Test set_secret creates, replaces, or refuses to replace a secret."""
     caplog.set_level(logging.DEBUG)
-    secret_name = faker.slug()
-    secret_value = faker.password()
-    mock_run_command.side_effect = [
-        [None, None, 0],  # "exists" command (yes, does exist)
-        [None, None, 0],  # "delete" command success
-        [None, None, 0],  # "create" command success
-    ]
+    secret_name = placeholder("secret")
+    mock_run_command.side_effect = run_command_results
 
-    assert podman_utils.set_secret(secret_name, secret_value)
-    assert f"Podman secret '{secret_name}' exists." == caplog.messages[0]
     assert (
-        f"Podman secret '{secret_name}' already exists before setting a new value."
-        == caplog.messages[1]
+        podman_utils.set_secret(secret_name, placeholder("value"), allow_replace)
+        is expected_return
     )
-    assert f"Podman secret '{secret_name}' was removed." == caplog.messages[2]
-    assert f"Podman secret '{secret_name}' was set." == caplog.messages[3]
-
-
-@mock.patch.object(podman_utils.shell_utils, "run_command")
-def test_set_secret_exists_but_no_replace(mock_run_command, faker, caplog):
-    """Test the set_secret function fails if secret exists but not told to replace."""
-    caplog.set_level(logging.ERROR)
-    secret_name = faker.slug()
-    secret_value = faker.password()
-    mock_run_command.side_effect = [
-        [None, None, 0],  # "exists" command (yes, does exist)
-        # no other commands expected
+    assert caplog.messages == [
+        message.format(secret_name=secret_name) for message in expected_messages
     ]
-
-    assert not podman_utils.set_secret(secret_name, secret_value, False)
-    assert (
-        f"Podman secret '{secret_name}' already exists before setting a new value."
-        == caplog.messages[0]
-    )
+    assert mock_run_command.call_count == len(run_command_results)
 
 
 @mock.patch.object(podman_utils.shell_utils, "run_command")
-def test_set_secret_failed_unexpectedly(mock_run_command, faker, caplog):
-    """Test the set_secret function when creating the secret fails unexpectedly."""
-    caplog.set_level(logging.DEBUG)
-    secret_name = faker.slug()
-    secret_value = faker.password()
-    mock_run_command.side_effect = [
-        [None, None, 1],  # "exists" command (no, does not exist)
-        [None, None, 1],  # "create" failed unexpectedly
-    ]
-
-    assert not podman_utils.set_secret(secret_name, secret_value)
-    assert f"Podman failed to set secret '{secret_name}'." == caplog.messages[-1]
-
-
-@mock.patch.object(podman_utils.shell_utils, "run_command")
-def test_delete_secret(mock_run_command, faker, caplog):
+def test_delete_secret(mock_run_command, placeholder, caplog):
     """Test the delete_secret function deletes a secret."""
     caplog.set_level(logging.INFO)
-    secret_name = faker.slug()
+    secret_name = placeholder("secret")
     mock_run_command.return_value = None, None, 0  # successful delete
 
     assert podman_utils.delete_secret(secret_name)
@@ -304,10 +280,10 @@ def test_delete_secret(mock_run_command, faker, caplog):
 
 
 @mock.patch.object(podman_utils.shell_utils, "run_command")
-def test_delete_secret_non_existent(mock_run_command, faker, caplog):
+def test_delete_secret_non_existent(mock_run_command, placeholder, caplog):
     """Test the delete_secret function returns False if the secret was not there."""
     caplog.set_level(logging.INFO)
-    secret_name = faker.slug()
+    secret_name = placeholder("secret")
     mock_run_command.return_value = None, None, 1  # "failed" because did not exist
 
     assert not podman_utils.delete_secret(secret_name)
@@ -315,10 +291,10 @@ def test_delete_secret_non_existent(mock_run_command, faker, caplog):
 
 
 @mock.patch.object(podman_utils.shell_utils, "run_command")
-def test_remove_image(mock_run_command, faker, caplog):
+def test_remove_image(mock_run_command, placeholder, caplog):
     """Test the remove_image function removes an image."""
     caplog.set_level(logging.INFO)
-    images_id = f"quay.io/{faker.slug()}/{faker.slug()}:latest"
+    images_id = f"quay.io/{placeholder('org')}/{placeholder('repo')}:latest"
     mock_run_command.return_value = None, None, 0  # successful delete
 
     assert podman_utils.remove_image(images_id)
@@ -326,32 +302,26 @@ def test_remove_image(mock_run_command, faker, caplog):
 
 
 @mock.patch.object(podman_utils.shell_utils, "run_command")
-def test_remove_image_already_removed(mock_run_command, faker, caplog):
+def test_remove_image_already_removed(mock_run_command, placeholder, caplog):
     """Test the remove_image function returns true if the image is already removed."""
     caplog.set_level(logging.DEBUG)
-    image_id = f"quay.io/{faker.slug()}/{faker.slug()}:latest"
+    image_id = f"quay.io/{placeholder('org')}/{placeholder('repo')}:latest"
     mock_run_command.return_value = None, None, 1  # "failed" because does not exist
 
     assert not podman_utils.remove_image(image_id)
     assert f"Failed to remove container image '{image_id}'." == caplog.messages[-1]
 
 
-def test_list_expected_podman_container_images(
-    tmp_path: pathlib.Path, monkeypatch, faker
-):
-    """Test test_list_expected_podman_container_images returns expected values."""
-    systemd_units_dir = pathlib.Path(tmp_path) / "systemd"
-    monkeypatch.setattr(
-        "quipucordsctl.podman_utils.settings.SYSTEMD_UNITS_DIR",
-        systemd_units_dir,
-    )
-    pathlib.Path.mkdir(systemd_units_dir)
+@pytest.fixture(scope="session")
+def systemd_units_tree(tmp_path_factory):
+    """Write the systemd unit files once and return their dir and expected images."""
+    systemd_units_dir = tmp_path_factory.mktemp("systemd")
     # Let's create systemd unit files with container Image paths
-    container_images = []
+    container_images = set()
     for unit_file in settings.TEMPLATE_SYSTEMD_UNITS_FILENAMES:
         unit_file_path = systemd_units_dir / unit_file
         if unit_file_path.suffix == ".container":
-            container_image = f"quay.io/{faker.slug()}/{faker.slug()}:latest"
+            container_image = f"quay.io/quipucords/{unit_file_path.stem}:latest"
             # let's create a bad unit file for testing Image skipping logic.
             if unit_file == "quipucords-redis.container":
                 unit_file_content = f"Requires=podman.socket\nImage={container_image}\n"
@@ -364,10 +334,19 @@ def test_list_expected_podman_container_images(
                     "[Container]\n"
                     f"Image={container_image}\n"
                 )
-                container_images.append(container_image)
+                container_images.add(container_image)
             unit_file_path.write_text(unit_file_content)
+    return systemd_units_dir, frozenset(container_images)
+
+
+def test_list_expected_podman_container_images(systemd_units_tree, monkeypatch):
+    """Test test_list_expected_podman_container_images returns expected values."""
+    systemd_units_dir, container_images = systemd_units_tree
+    monkeypatch.setattr(
+        "quipucordsctl.podman_utils.settings.SYSTEMD_UNITS_DIR",
+        systemd_units_dir,
+    )
 
-    container_images = set(container_images)
     assert len(container_images) > 1
     actual_container_images = podman_utils.list_expected_podman_container_images()
     assert actual_container_images == container_images
@@ -434,10 +413,10 @@ def test_verify_podman_argument_string_value_error(value):
 
 
 @mock.patch.object(podman_utils.shell_utils, "run_command")
-def test_get_secret_value_success(mock_run_command, faker):
+def test_get_secret_value_success(mock_run_command, placeholder):
     """Test get_secret_value returns the secret value when it exists."""
-    secret_name = faker.slug()
-    secret_value = faker.password()
+    secret_name = placeholder("secret")
+    secret_value = placeholder("value")
     mock_run_command.side_effect = [
         [None, None, 0],
         [secret_value, None, 0],
@@ -448,9 +427,9 @@ def test_get_secret_value_success(mock_run_command, faker):
 
 
 @mock.patch.object(podman_utils.shell_utils, "run_command")
-def test_get_secret_value_not_exists(mock_run_command, faker):
+def test_get_secret_value_not_exists(mock_run_command, placeholder):
     """Test get_secret_value returns None when secret does not exist."""
-    secret_name = faker.slug()
+    secret_name = placeholder("secret")
     mock_run_command.side_effect = [
         [None, None, 1],
     ]
@@ -460,10 +439,10 @@ def test_get_secret_value_not_exists(mock_run_command, faker):
 
 
 @mock.patch.object(podman_utils.shell_utils, "run_command")
-def test_get_secret_value_inspect_fails(mock_run_command, faker, caplog):
+def test_get_secret_value_inspect_fails(mock_run_command, placeholder, caplog):
     """Test get_secret_value returns None when inspect command fails unexpectedly."""
     caplog.set_level(logging.DEBUG)
-    secret_name = faker.slug()
+    secret_name = placeholder("secret")
     mock_run_command.side_effect = [
         [None, None, 0],
         [None, None, 1],  # "inspect" command failed
@@ -489,9 +468,9 @@ def test_get_secret_value_empty_string(value):
 
 
 @mock.patch.object(podman_utils.shell_utils, "run_command")
-def test_get_secret_value_calls_correct_command(mock_run_command, faker):
+def test_get_secret_value_calls_correct_command(mock_run_command, placeholder):
     """Test get_secret_value calls podman with correct arguments."""
-    secret_name = faker.slug()
+    secret_name = placeholder("secret")
     mock_run_command.side_effect = [
         [None, None, 0],
         ["secret_data", None, 0],
@@ -733,8 +712,8 @@ def test_login_to_registry_success(  # noqa: PLR0913
 
 @mock.patch.object(podman_utils.shell_utils, "run_command")
 @mock.patch.object(podman_utils.shell_utils, "confirm")
-def test_login_to_registry_but_user_says_no(  # noqa: PLR0913
-    mock_confirm, mock_run_command, faker, caplog, capsys
+def test_login_to_registry_but_user_says_no(
+    mock_confirm, mock_run_command, faker, caplog
 ):
     """Test login_to_registry returns False if the user chooses not to log in."""
     caplog.set_level(logging.INFO)
@@ -802,10 +781,11 @@ def test_login_to_registry_empty_password(
     assert "Password cannot be empty." in caplog.messages[-1]
 
 
-@mock.patch.object(podman_utils.settings, "runtime")
-def test_login_to_registry_quiet_mode(mock_runtime):
+def test_login_to_registry_quiet_mode(monkeypatch):
     """Test login_to_registry returns False in quiet mode without prompting."""
-    mock_runtime.quiet = True
+    monkeypatch.setattr(
+        podman_utils.settings, "runtime", types.SimpleNamespace(quiet=True)
+    )
     registry = "registry.redhat.io"
 
     assert not podman_utils.login_to_registry(registry)
@@ -946,14 +926,15 @@ def test_ensure_images_pull_fails(  # noqa: PLR0913
     assert not podman_utils.ensure_images()
 
 
-@mock.patch.object(podman_utils.settings, "runtime")
 @mock.patch.object(podman_utils.shell_utils, "confirm")
 @mock.patch.object(podman_utils, "get_missing_images")
 def test_ensure_images_quiet_mode_no_output(
-    mock_get_missing, mock_confirm, mock_runtime, faker, capsys
+    mock_get_missing, mock_confirm, faker, capsys, monkeypatch
 ):
     """Test ensure_images produces no output in quiet mode when user declines."""
-    mock_runtime.quiet = True
+    monkeypatch.setattr(
+        podman_utils.settings, "runtime", types.SimpleNamespace(quiet=True)
+    )
     missing_image = f"registry.redhat.io/{faker.slug()}:latest"
     mock_get_missing.return_value = {missing_image}
     mock_confirm.return_value = False
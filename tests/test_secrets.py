@@ -2,43 +2,54 @@
 
 import dataclasses
 import logging
+import types
 from unittest import mock
 
 import pytest
 
 from quipucordsctl import secrets
 
+VALID_SECRET = "1234567890abcdef"
 
-@pytest.mark.parametrize(
-    "new_secret,kwargs,expected_result",
-    [
-        ("1234567890123456", {}, False),  # cannot be only numbers
-        ("1234567890!@#$%^", {}, False),  # needs a letter
-        ("abcdefghijabcdef", {}, False),  # needs a number
-        ("abcd1234", {}, False),  # too short
-        ("1234567890abcdef", {}, True),  # OK with defaults
-        ("abcd1234", {"min_length": 4}, True),  # OK with custom min_length
-        ("What? 1 + 2 = 3!", {}, True),  # spaces and punctuation are OK
-        ("123456789012345678901234567890abcd", {}, True),  # longer than minimum is OK
-        (
-            "1234567890abcdef",
-            {"blocklist": ["hello", "1234567890abcdef", "world"]},
-            False,  # cannot be in blocklist
-        ),
-        (
-            "1234567890abcdef",
-            {
-                "check_similar": secrets.SimilarValueCheck(
-                    "1234567890abcde!", "name of other value", 0.2
-                ),
-            },
-            False,  # cannot be too similar to given comparison value
-        ),
-    ],
+check_secret_valid_cases = (
+    pytest.param(VALID_SECRET, {}, id="defaults"),
+    pytest.param("abcd1234", {"min_length": 4}, id="custom-min-length"),
+    pytest.param("What? 1 + 2 = 3!", {}, id="spaces-and-punctuation"),
+    pytest.param("123456789012345678901234567890abcd", {}, id="longer-than-min-length"),
 )
-def test_check_secret(new_secret, kwargs, expected_result):
-    """Test check_secret requires sufficiently complex inputs."""
-    assert secrets.check_secret(new_secret, **kwargs) == expected_result
+
+check_secret_invalid_cases = (
+    pytest.param("1234567890123456", {}, id="only-numbers"),
+    pytest.param("1234567890!@#$%^", {}, id="needs-a-letter"),
+    pytest.param("abcdefghijabcdef", {}, id="needs-a-number"),
+    pytest.param("abcd1234", {}, id="too-short"),
+    pytest.param(
+        VALID_SECRET,
+        {"blocklist": ["hello", VALID_SECRET, "world"]},
+        id="in-blocklist",
+    ),
+    pytest.param(
+        VALID_SECRET,
+        {
+            "check_similar": secrets.SimilarValueCheck(
+                "1234567890abcde!", "name of other value", 0.2
+            ),
+        },
+        id="too-similar",
+    ),
+)
+
+
+@pytest.mark.parametrize("new_secret,kwargs", check_secret_valid_cases)
+def test_check_secret_valid(new_secret, kwargs):
+    """Test check_secret accepts sufficiently complex inputs."""
+    assert secrets.check_secret(new_secret, **kwargs)
+
+
+@pytest.mark.parametrize("new_secret,kwargs", check_secret_invalid_cases)
+def test_check_secret_invalid(new_secret, kwargs):
+    """Test check_secret rejects insufficiently complex inputs."""
+    assert not secrets.check_secret(new_secret, **kwargs)
 
 
 @mock.patch.object(secrets.getpass, "getpass")
@@ -185,10 +196,14 @@ def test_get_new_secret_value(
     podman_secret_name = faker.slug()
     input_value = faker.password()
 
-    secrets_runtime = mocker.patch.object(secrets.settings, "runtime")
-    shell_utils_runtime = mocker.patch.object(secrets.shell_utils.settings, "runtime")
-    secrets_runtime.quiet = shell_utils_runtime.quiet = test_case.simulate_quiet_mode
-    secrets_runtime.yes = shell_utils_runtime.yes = test_case.simulate_yes_mode
+    # secrets and shell_utils share the same settings module.
+    mocker.patch.object(
+        secrets.settings,
+        "runtime",
+        types.SimpleNamespace(
+            quiet=test_case.simulate_quiet_mode, yes=test_case.simulate_yes_mode
+        ),
+    )
 
     if not test_case.simulate_quiet_mode and not test_case.simulate_yes_mode:
         mocker.patch.object(
@@ -3,6 +3,7 @@
 import logging
 import pathlib
 import subprocess
+import types
 from unittest import mock
 
 import pytest
@@ -51,13 +52,13 @@ def test_confirm(mock_input, user_inputs, expected, capsys):
     ),
 )
 @mock.patch("builtins.input")
-@mock.patch.object(shell_utils.settings, "runtime")
 def test_confirm_skipped_via_args(  # noqa: PLR0913
-    mock_runtime, mock_input, yes, quiet, expect_input, expected_result, faker, capsys
+    mock_input, yes, quiet, expect_input, expected_result, faker, monkeypatch
 ):
     """Test confirm handles various "yes" and "quiet" settings."""
-    mock_runtime.yes = yes
-    mock_runtime.quiet = quiet
+    monkeypatch.setattr(
+        shell_utils.settings, "runtime", types.SimpleNamespace(yes=yes, quiet=quiet)
+    )
     mock_input.return_value = "y"
     prompt = faker.sentence()
 
@@ -2,6 +2,7 @@
 
 import os
 import subprocess
+import types
 from unittest import mock
 
 import pytest
@@ -12,7 +13,9 @@ from quipucordsctl import settings, systemctl_utils
 @pytest.fixture
 def mock_shell_utils():
     """Mock the entire shell_utils module to prevent external program execution."""
-    with mock.patch.object(systemctl_utils, "shell_utils") as mock_shell_utils:
+    with mock.patch.object(
+        systemctl_utils, "shell_utils", autospec=True
+    ) as mock_shell_utils:
         yield mock_shell_utils
 
 
@@ -117,34 +120,41 @@ def test_check_service_running_when_inactive(mock_shell_utils):
     assert systemctl_utils.check_service_running() is False
 
 
-def test_log_start_failure_details_prints_stdout(mock_shell_utils, capsys):
+def test_log_start_failure_details_prints_stdout(mock_shell_utils, capsys, monkeypatch):
     """Test log_start_failure_details prints status output when not quiet."""
     mock_shell_utils.run_command.return_value = ("service status output", "", 1)
-    with mock.patch.object(systemctl_utils.settings, "runtime") as mock_runtime:
-        mock_runtime.quiet = False
-        systemctl_utils.log_start_failure_details()
+    monkeypatch.setattr(
+        systemctl_utils.settings, "runtime", types.SimpleNamespace(quiet=False)
+    )
+    systemctl_utils.log_start_failure_details()
 
     captured = capsys.readouterr()
     assert "service status output" in captured.out
 
 
-def test_log_start_failure_details_quiet_suppresses_stdout(mock_shell_utils, capsys):
+def test_log_start_failure_details_quiet_suppresses_stdout(
+    mock_shell_utils, capsys, monkeypatch
+):
     """Test log_start_failure_details skips printing status output in quiet mode."""
     mock_shell_utils.run_command.return_value = ("service status output", "", 1)
-    with mock.patch.object(systemctl_utils.settings, "runtime") as mock_runtime:
-        mock_runtime.quiet = True
-        systemctl_utils.log_start_failure_details()
+    monkeypatch.setattr(
+        systemctl_utils.settings, "runtime", types.SimpleNamespace(quiet=True)
+    )
+    systemctl_utils.log_start_failure_details()
 
     captured = capsys.readouterr()
     assert captured.out == ""
 
 
-def test_log_start_failure_details_logs_guidance_message(mock_shell_utils, caplog):
+def test_log_start_failure_details_logs_guidance_message(
+    mock_shell_utils, caplog, monkeypatch
+):
     """Test log_start_failure_details always logs guidance via logger.error."""
     mock_shell_utils.run_command.return_value = ("service status output", "", 1)
-    with mock.patch.object(systemctl_utils.settings, "runtime") as mock_runtime:
-        mock_runtime.quiet = True
-        systemctl_utils.log_start_failure_details()
+    monkeypatch.setattr(
+        systemctl_utils.settings, "runtime", types.SimpleNamespace(quiet=True)
+    )
+    systemctl_utils.log_start_failure_details()
 
     assert any("journalctl --user -u" in r.message for r in caplog.records)
 